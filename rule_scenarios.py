@@ -0,0 +1,44 @@
+"""Rule matrix shared by the SmartRoom scenario tests and the decision engine tests."""
+
+# (light_on, occupied, enough_light) -> light_on
+LIGHT_SCENARIOS = [
+    (False, True, False, True),
+    (False, True, True, False),
+    (False, False, False, False),
+    (False, False, True, False),
+    (True, True, False, True),
+    (True, True, True, False),
+    (True, False, False, False),
+    (True, False, True, False),
+]
+
+# (window_open, indoor, outdoor) -> (servo angle or None, window_open)
+WINDOW_SCENARIOS = [
+    (False, 20, 23, 12, True),
+    (True, 27, 24, 2, False),
+    (True, 17.9, 30, 2, False),
+    (True, 22, 31.1, 2, False),
+    (True, 22, 23.5, None, True),
+    (False, 17, 31, 2, False),
+    # bounds are inclusive and the gap must exceed 2
+    (False, 18, 20.1, 12, True),
+    (False, 27.5, 30, 12, True),
+    (True, 30, 27.9, 2, False),
+    (True, 20.1, 18, 2, False),
+    (True, 18, 30.1, 2, False),
+    (False, 20, 22, None, False),
+    (True, 22, 20, None, True),
+]
+
+# (fan_on, co2) -> (pin write or None, fan_on)
+FAN_SCENARIOS = [
+    (False, 800, True, True),
+    (True, 499, False, False),
+    (True, 600, None, True),
+    (False, 700, None, False),
+    (True, 900, None, True),
+    (False, 400, None, False),
+    # on at >= 800, off below 500
+    (False, 799, None, False),
+    (True, 500, None, True),
+]
@@ -0,0 +1,95 @@
+"""Runs every test module as a shard and records the suite's runtime.
+
+Usage: python run_tests.py [--jobs N] [--output FILE] [--baseline FILE] [--update-baseline]
+
+Timings are written as JSON to ``--output``. When the baseline file exists,
+any shard (or the total) that got slower than the baseline by more than
+``--tolerance`` is reported and the run exits with status 1.
+"""
+import argparse
+import io
+import json
+import sys
+import time
+import unittest
+from multiprocessing import Pool
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+# Differences below this are timer noise for suites that run in milliseconds.
+MIN_REGRESSION_SECONDS = 0.05
+
+
+def test_modules() -> list:
+    return sorted(path.stem for path in ROOT.glob("test_*.py"))
+
+
+def run_shard(module: str) -> dict:
+    start = time.perf_counter()
+    suite = unittest.defaultTestLoader.loadTestsFromName(module)
+    result = unittest.TextTestRunner(stream=io.StringIO(), verbosity=0).run(suite)
+    return {
+        "module": module,
+        "tests": result.testsRun,
+        "ok": result.wasSuccessful(),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def run(jobs: int) -> dict:
+    modules = test_modules()
+    start = time.perf_counter()
+    if jobs > 1:
+        with Pool(jobs) as pool:
+            shards = pool.map(run_shard, modules)
+    else:
+        shards = [run_shard(module) for module in modules]
+    return {
+        "jobs": jobs,
+        "total_seconds": time.perf_counter() - start,
+        "shards": {shard.pop("module"): shard for shard in shards},
+    }
+
+
+def regressions(results: dict, baseline: dict, tolerance: float) -> list:
+    timings = [("total", results["total_seconds"], baseline.get("total_seconds"))]
+    timings += [(module, shard["seconds"], baseline.get("shards", {}).get(module, {}).get("seconds"))
+                for module, shard in results["shards"].items()]
+    return [(name, seconds, previous) for name, seconds, previous in timings
+            if previous is not None
+            and seconds > previous * (1 + tolerance)
+            and seconds - previous > MIN_REGRESSION_SECONDS]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=1)
+    parser.add_argument("--output", default=str(ROOT / "test_timings.json"))
+    parser.add_argument("--baseline", default=str(ROOT / "test_timings_baseline.json"))
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, str(ROOT))
+    results = run(args.jobs)
+    Path(args.output).write_text(json.dumps(results, indent=2))
+
+    for module, shard in results["shards"].items():
+        status = "ok" if shard["ok"] else "FAILED"
+        print(f"{module}: {shard['tests']} tests {status} in {shard['seconds'] * 1000:.1f} ms")
+    print(f"total ({args.jobs} jobs): {results['total_seconds'] * 1000:.1f} ms")
+
+    failed = not all(shard["ok"] for shard in results["shards"].values())
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        baseline_path.write_text(json.dumps(results, indent=2))
+    elif baseline_path.exists():
+        slower = regressions(results, json.loads(baseline_path.read_text()), args.tolerance)
+        for name, seconds, previous in slower:
+            print(f"REGRESSION {name}: {previous * 1000:.1f} ms -> {seconds * 1000:.1f} ms")
+        failed = failed or bool(slower)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+_UNKNOWN = object()
+
+
+class ActuatorBank:
+    """Coalesces actuator commands and writes only real changes.
+
+    ``set_pin`` and ``set_servo`` record the wanted state. ``flush`` writes
+    every pin or servo whose wanted state differs from the last one written,
+    once per tick, through ``write_pin(pin, value)`` and
+    ``write_servo(servo, angle)``. ``force_resync`` makes the next flush
+    rewrite every known state, e.g. after a power glitch reset the hardware.
+    """
+
+    def __init__(self, write_pin, write_servo):
+        self._write_pin = write_pin
+        self._write_servo = write_servo
+        self._pins = {}
+        self._servos = {}
+        self._pending_pins = {}
+        self._pending_servos = {}
+        self.writes = 0
+        self.skipped = 0
+
+    def set_pin(self, pin: int, value: bool) -> None:
+        self._request(self._pins, self._pending_pins, pin, value)
+
+    def set_servo(self, servo, angle: float) -> None:
+        self._request(self._servos, self._pending_servos, servo, angle)
+
+    def pin_state(self, pin: int):
+        """Last value written to ``pin``, or None if unknown (never written or resynced)."""
+        return self._pins.get(pin)
+
+    def servo_state(self, servo):
+        return self._servos.get(servo)
+
+    def flush(self) -> int:
+        """Writes the pending changes and returns how many writes were made."""
+        written = 0
+        for pin, value in self._pending_pins.items():
+            self._write_pin(pin, value)
+            self._pins[pin] = value
+            written += 1
+        self._pending_pins.clear()
+        for servo, angle in self._pending_servos.items():
+            self._write_servo(servo, angle)
+            self._servos[servo] = angle
+            written += 1
+        self._pending_servos.clear()
+        self.writes += written
+        return written
+
+    def force_resync(self) -> None:
+        """Forgets what the hardware holds so the next flush rewrites every state."""
+        self._pending_pins = {**self._pins, **self._pending_pins}
+        self._pins.clear()
+        self._pending_servos = {**self._servos, **self._pending_servos}
+        self._servos.clear()
+
+    def _request(self, written: dict, pending: dict, key, value) -> None:
+        if written.get(key, _UNKNOWN) != value:
+            pending[key] = value
+        elif key in pending:
+            # Back to the written state before the flush: cancel the change.
+            del pending[key]
+        else:
+            self.skipped += 1
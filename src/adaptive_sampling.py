@@ -0,0 +1,53 @@
+from src.decision_engine import DEFAULT_THRESHOLDS, Thresholds
+
+
+def time_to_threshold(value: float, thresholds, max_rate: float) -> float:
+    """Shortest time in which ``value`` could reach any threshold changing at ``max_rate`` per second."""
+    if max_rate <= 0:
+        raise ValueError("max_rate must be positive")
+    return min(abs(value - threshold) for threshold in thresholds) / max_rate
+
+
+def co2_time_to_threshold(co2: float, max_rate: float, thresholds: Thresholds = DEFAULT_THRESHOLDS) -> float:
+    return time_to_threshold(co2, (thresholds.fan_off_co2, thresholds.fan_on_co2), max_rate)
+
+
+def window_time_to_threshold(indoor: float, outdoor: float, max_rate: float,
+                             thresholds: Thresholds = DEFAULT_THRESHOLDS) -> float:
+    """Like time_to_threshold for the window rule: both range bounds and the indoor/outdoor gap.
+
+    ``max_rate`` bounds each temperature, so the gap can change twice as fast.
+    """
+    bounds = (thresholds.min_temperature, thresholds.max_temperature)
+    gap = thresholds.temperature_gap
+    return min(time_to_threshold(indoor, bounds, max_rate),
+               time_to_threshold(outdoor, bounds, max_rate),
+               time_to_threshold(outdoor - indoor, (-gap, gap), 2 * max_rate))
+
+
+class AdaptiveSampler:
+    """Schedules the reads of one sensor on a grid of ``base_interval`` ticks.
+
+    After each read the next one is pushed out by as many whole ticks as fit
+    in the reading's time to threshold, between 1 and ``max_ticks``. Between
+    two reads the value cannot cross a threshold, so every state change a
+    read on every tick would make is still made on the same tick.
+    """
+
+    def __init__(self, base_interval: float = 1.0, max_ticks: int = 60):
+        if base_interval <= 0 or max_ticks < 1:
+            raise ValueError("base_interval must be positive and max_ticks at least 1")
+        self.base_interval = base_interval
+        self.max_ticks = max_ticks
+        self.next_tick = 0
+        self.reads = 0
+
+    def due(self, tick: int) -> bool:
+        return tick >= self.next_tick
+
+    def record(self, tick: int, time_to_threshold: float) -> int:
+        """Registers a read made at ``tick`` and returns the number of ticks until the next one."""
+        ticks = min(max(1, int(time_to_threshold // self.base_interval)), self.max_ticks)
+        self.next_tick = tick + ticks
+        self.reads += 1
+        return ticks
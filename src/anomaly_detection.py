@@ -0,0 +1,107 @@
+import math
+
+
+class SensorGuard:
+    """Screens one sensor feed before its readings reach the decision logic.
+
+    A reading is faulty when it is missing (None or NaN), lies outside
+    ``[min_value, max_value]``, repeats the same value ``stuck_after`` times
+    in a row, or deviates from an EWMA of the feed by more than
+    ``threshold`` standard deviations (and at least ``min_deviation``).
+    Stuck detection is off by default: a stable room legitimately reports
+    the same whole-ppm CO2 value for long runs. Faulty readings are
+    replaced by the last good one. After ``quarantine_after`` consecutive
+    faults the sensor is quarantined and stays so until ``release_after``
+    consecutive good readings arrive. Every update is O(1).
+    """
+
+    HEALTHY = "healthy"
+    QUARANTINED = "quarantined"
+
+    def __init__(self, alpha: float = 0.1, threshold: float = 4.0, min_deviation: float = 1.0,
+                 warmup: int = 10, stuck_after: int = None, quarantine_after: int = 3, release_after: int = 5,
+                 min_value: float = None, max_value: float = None):
+        self.alpha = alpha
+        self.threshold = threshold
+        self.min_deviation = min_deviation
+        self.warmup = warmup
+        self.stuck_after = stuck_after
+        self.quarantine_after = quarantine_after
+        self.release_after = release_after
+        self.min_value = min_value
+        self.max_value = max_value
+        self.state = self.HEALTHY
+        self.last_good = None
+        self.faults = 0
+        self._mean = 0.0
+        self._variance = 0.0
+        self._samples = 0
+        self._previous = None
+        self._repeats = 0
+        self._consecutive_faults = 0
+        self._consecutive_good = 0
+
+    @property
+    def quarantined(self) -> bool:
+        return self.state == self.QUARANTINED
+
+    def update(self, value):
+        """Returns the reading the decision logic should use, or None if no good reading exists yet."""
+        deviates = False
+        if self._is_missing_or_out_of_range(value) or self._is_stuck(value):
+            faulty = True
+        else:
+            deviates = self._deviates(value)
+            faulty = deviates
+
+        if faulty:
+            self.faults += 1
+            self._consecutive_faults += 1
+            self._consecutive_good = 0
+            if self._consecutive_faults >= self.quarantine_after:
+                self.state = self.QUARANTINED
+                if deviates:
+                    # A sustained deviation is a level shift: relearn from here on.
+                    self._samples = 0
+            return self.last_good
+
+        self._learn(value)
+        self._consecutive_faults = 0
+        self._consecutive_good += 1
+        if self.quarantined and self._consecutive_good >= self.release_after:
+            self.state = self.HEALTHY
+        if not self.quarantined:
+            self.last_good = value
+        return self.last_good
+
+    def _is_missing_or_out_of_range(self, value) -> bool:
+        if value is None or math.isnan(value):
+            self._previous = None
+            return True
+        return ((self.min_value is not None and value < self.min_value)
+                or (self.max_value is not None and value > self.max_value))
+
+    def _is_stuck(self, value) -> bool:
+        if value == self._previous:
+            self._repeats += 1
+        else:
+            self._previous = value
+            self._repeats = 1
+        return self.stuck_after is not None and self._repeats >= self.stuck_after
+
+    def _deviates(self, value) -> bool:
+        if self._samples < self.warmup:
+            return False
+        allowed = max(self.threshold * math.sqrt(self._variance), self.min_deviation)
+        return abs(value - self._mean) > allowed
+
+    def _learn(self, value) -> None:
+        if self._samples == 0:
+            self._mean = value
+            self._variance = 0.0
+        else:
+            difference = value - self._mean
+            increment = self.alpha * difference
+            self._mean += increment
+            self._variance = (1 - self.alpha) * (self._variance + difference * increment)
+        self._samples += 1
@@ -0,0 +1,92 @@
+from array import array
+
+# Pin numbers used by SmartRoom.
+INFRARED_PIN = 22
+PHOTO_PIN = 13
+LED_PIN = 18
+FAN_PIN = 6
+
+
+class DriverBackend:
+    """Hardware access for one room through the real drivers.
+
+    ``gpio`` is the GPIO module, ``indoor`` and ``outdoor`` are BMP280
+    sensors and ``co2_sensor`` is the Senseair S8, so a room gets its own
+    devices instead of patching module attributes shared by every room.
+    """
+
+    def __init__(self, gpio, indoor, outdoor, co2_sensor):
+        self._gpio = gpio
+        self._indoor = indoor
+        self._outdoor = outdoor
+        self._co2_sensor = co2_sensor
+
+    def input(self, pin: int) -> bool:
+        return self._gpio.input(pin)
+
+    def output(self, pin: int, value: bool) -> None:
+        self._gpio.output(pin, value)
+
+    def indoor_temperature(self) -> float:
+        return self._indoor.temperature
+
+    def outdoor_temperature(self) -> float:
+        return self._outdoor.temperature
+
+    def co2(self) -> float:
+        return self._co2_sensor.co2()
+
+
+class InMemoryBackend:
+    """Pins and sensor values of many rooms held in shared arrays.
+
+    Every pin is a ``bytearray`` and every sensor an ``array('d')`` with one
+    entry per room, so a load test sets inputs for the whole fleet with slice
+    assignment and reads every output the same way. ``room(i)`` returns a
+    view with the DriverBackend interface.
+    """
+
+    def __init__(self, rooms: int, pins=(INFRARED_PIN, PHOTO_PIN, LED_PIN, FAN_PIN)):
+        self.rooms = rooms
+        self.pins = {pin: bytearray(rooms) for pin in pins}
+        self.indoor = array("d", bytes(8 * rooms))
+        self.outdoor = array("d", bytes(8 * rooms))
+        self.co2 = array("d", bytes(8 * rooms))
+
+    def __len__(self) -> int:
+        return self.rooms
+
+    @property
+    def nbytes(self) -> int:
+        sensors = (self.indoor, self.outdoor, self.co2)
+        return sum(len(values) for values in self.pins.values()) + sum(len(values) * values.itemsize for values in sensors)
+
+    def room(self, index: int) -> "RoomBackend":
+        if not 0 <= index < self.rooms:
+            raise IndexError(f"no room at index {index}")
+        return RoomBackend(self, index)
+
+
+class RoomBackend:
+    """One room of an InMemoryBackend."""
+
+    __slots__ = ("_backend", "_index")
+
+    def __init__(self, backend: InMemoryBackend, index: int):
+        self._backend = backend
+        self._index = index
+
+    def input(self, pin: int) -> bool:
+        return bool(self._backend.pins[pin][self._index])
+
+    def output(self, pin: int, value: bool) -> None:
+        self._backend.pins[pin][self._index] = bool(value)
+
+    def indoor_temperature(self) -> float:
+        return self._backend.indoor[self._index]
+
+    def outdoor_temperature(self) -> float:
+        return self._backend.outdoor[self._index]
+
+    def co2(self) -> float:
+        return self._backend.co2[self._index]
@@ -0,0 +1,86 @@
+import queue
+import threading
+from concurrent.futures import Future
+
+_STOP = object()
+
+
+class _BusWorker:
+
+    def __init__(self, name: str, batch_size: int):
+        self.name = name
+        self.batch_size = batch_size
+        self.queue = queue.SimpleQueue()
+        self.reads = 0
+        self.batches = 0
+        self.thread = threading.Thread(target=self._run, name=f"bus-{name}", daemon=True)
+        self.thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            self.batches += 1
+            for item in batch:
+                if item is _STOP:
+                    return
+                future, read, args = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(read(*args))
+                except BaseException as error:
+                    future.set_exception(error)
+                self.reads += 1
+
+
+class BusWorkerPool:
+    """One worker thread per physical bus, shared by every room.
+
+    ``submit("i2c", lambda: bmp280.temperature)`` queues a read on the I2C
+    worker and returns a ``concurrent.futures.Future`` at once. Each worker
+    owns its bus, so reads on one bus never overlap each other, while reads
+    on different buses (the BMP280s on I2C, the Senseair S8 on UART) run at
+    the same time. A worker takes everything queued, up to ``batch_size``
+    reads, in one go, so callers keep queueing while the bus is busy.
+    """
+
+    def __init__(self, buses, batch_size: int = 64):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self._workers = {name: _BusWorker(name, batch_size) for name in buses}
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def submit(self, bus: str, read, *args) -> Future:
+        if self._closed:
+            raise RuntimeError("pool is closed")
+        future = Future()
+        self._workers[bus].queue.put((future, read, args))
+        return future
+
+    def map(self, bus: str, reads) -> list:
+        """Submits every zero-argument read to ``bus`` and returns their futures in order."""
+        return [self.submit(bus, read) for read in reads]
+
+    def stats(self) -> dict:
+        return {name: {"reads": worker.reads, "batches": worker.batches} for name, worker in self._workers.items()}
+
+    def close(self) -> None:
+        """Finishes every queued read and stops the workers."""
+        if self._closed:
+            return
+        self._closed = True
+        for worker in self._workers.values():
+            worker.queue.put(_STOP)
+        for worker in self._workers.values():
+            worker.thread.join()
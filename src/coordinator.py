@@ -0,0 +1,102 @@
+import time
+
+from src.metrics import Metrics
+
+WINDOW = "window"
+FAN = "fan"
+
+# Lower runs first: air quality before comfort.
+PRIORITIES = {FAN: 0, WINDOW: 1}
+
+
+class Request:
+    __slots__ = ("room", "actuator", "value", "priority", "tick", "time", "sequence")
+
+    def __init__(self, room, actuator: str, value, priority: int, tick: int, time: float, sequence: int):
+        self.room = room
+        self.actuator = actuator
+        self.value = value
+        self.priority = priority
+        self.tick = tick
+        self.time = time
+        self.sequence = sequence
+
+
+class ActuationCoordinator:
+    """Queues actuator writes from every room and spreads them across ticks.
+
+    Each ``tick`` executes at most ``max_servo_moves`` window moves, at most
+    ``max_fan_starts`` fan starts and, if set, at most ``max_actuations``
+    writes in total. Fan stops draw no inrush current and only count towards
+    ``max_actuations``. Requests run in priority order (fans before windows)
+    and first come first served within a priority. A request's priority
+    improves by one for every ``aging`` ticks it waits, so a window is never
+    starved by a steady stream of fan starts. A newer request for the same
+    room and actuator replaces the queued value but keeps its place.
+
+    ``actuate(room, actuator, value)`` performs the write. Latency from
+    request to write is observed as ``actuation_latency_seconds`` in
+    ``metrics``; ``queue_depth`` and ``max_queue_depth`` track the backlog.
+    """
+
+    def __init__(self, actuate, max_servo_moves: int = 2, max_fan_starts: int = 2, max_actuations: int = None,
+                 aging: int = 5, metrics: Metrics = None, clock=time.monotonic):
+        if max_servo_moves < 1 or max_fan_starts < 1 or (max_actuations is not None and max_actuations < 1):
+            raise ValueError("budgets must be at least 1")
+        self._actuate = actuate
+        self.max_servo_moves = max_servo_moves
+        self.max_fan_starts = max_fan_starts
+        self.max_actuations = max_actuations
+        self.aging = aging
+        self.metrics = Metrics() if metrics is None else metrics
+        self._clock = clock
+        self._pending = {}
+        self._ticks = 0
+        self._sequence = 0
+        self.max_queue_depth = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._pending)
+
+    def request(self, room, actuator: str, value) -> None:
+        key = (room, actuator)
+        queued = self._pending.get(key)
+        if queued is not None:
+            queued.value = value
+            return
+        self._pending[key] = Request(room, actuator, value, PRIORITIES[actuator], self._ticks, self._clock(),
+                                     self._sequence)
+        self._sequence += 1
+        self.max_queue_depth = max(self.max_queue_depth, len(self._pending))
+
+    def cancel(self, room, actuator: str) -> None:
+        self._pending.pop((room, actuator), None)
+
+    def tick(self) -> list:
+        """Executes the requests that fit this tick's budgets and returns them."""
+        ticks = self._ticks
+        queue = sorted(self._pending.values(),
+                       key=lambda request: (request.priority - (ticks - request.tick) // self.aging, request.sequence))
+        servo_moves = fan_starts = 0
+        executed = []
+        for request in queue:
+            if self.max_actuations is not None and len(executed) >= self.max_actuations:
+                break
+            if request.actuator == WINDOW:
+                if servo_moves >= self.max_servo_moves:
+                    continue
+                servo_moves += 1
+            elif request.value:
+                if fan_starts >= self.max_fan_starts:
+                    continue
+                fan_starts += 1
+            del self._pending[(request.room, request.actuator)]
+            self._actuate(request.room, request.actuator, request.value)
+            executed.append(request)
+        now = self._clock()
+        for request in executed:
+            self.metrics.observe("actuation_latency_seconds", now - request.time)
+        self.metrics.count("actuations", len(executed))
+        self._ticks += 1
+        return executed
@@ -0,0 +1,80 @@
+from array import array
+from typing import NamedTuple
+
+
+class Thresholds(NamedTuple):
+    min_temperature: float = 18
+    max_temperature: float = 30
+    temperature_gap: float = 2
+    fan_on_co2: float = 800
+    fan_off_co2: float = 500
+    open_angle: int = 12
+    closed_angle: int = 2
+
+
+DEFAULT_THRESHOLDS = Thresholds()
+
+
+class Decision(NamedTuple):
+    """Target state of every room and the actuator writes needed to reach it.
+
+    ``actions`` lists ``(room index, value)`` pairs in room order: the LED
+    value, the servo angle or the fan value to write.
+    """
+    states: array
+    actions: list
+
+
+def decide_light(light_on, occupied, enough_light) -> Decision:
+    """Light on iff the room is occupied and there is not enough light.
+
+    Like SmartRoom.manage_light_level, the LED is written for every room on
+    every tick, so ``light_on`` only has to have the same length.
+    """
+    if not len(light_on) == len(occupied) == len(enough_light):
+        raise ValueError("all inputs must have one entry per room")
+    states = array("B", [bool(person) and not bright for person, bright in zip(occupied, enough_light)])
+    return Decision(states, [(room, bool(on)) for room, on in enumerate(states)])
+
+
+def decide_window(window_open, indoor, outdoor, thresholds: Thresholds = DEFAULT_THRESHOLDS) -> Decision:
+    """Open when both temperatures are in range and outdoor exceeds indoor by more than the gap.
+
+    Close when indoor exceeds outdoor by more than the gap, and whenever a
+    temperature is out of range, even if the window is already closed.
+    """
+    if not len(window_open) == len(indoor) == len(outdoor):
+        raise ValueError("all inputs must have one entry per room")
+    low, high, gap = thresholds.min_temperature, thresholds.max_temperature, thresholds.temperature_gap
+    open_angle, closed_angle = thresholds.open_angle, thresholds.closed_angle
+    states = array("B", window_open)
+    actions = []
+    for room, (inside, outside) in enumerate(zip(indoor, outdoor)):
+        if low <= inside <= high and low <= outside <= high:
+            if outside - inside > gap:
+                states[room] = True
+                actions.append((room, open_angle))
+            elif inside - outside > gap:
+                states[room] = False
+                actions.append((room, closed_angle))
+        else:
+            states[room] = False
+            actions.append((room, closed_angle))
+    return Decision(states, actions)
+
+
+def decide_fan(fan_on, co2, thresholds: Thresholds = DEFAULT_THRESHOLDS) -> Decision:
+    """Fan on at CO2 >= fan_on_co2, off below fan_off_co2; only changes are written."""
+    if len(fan_on) != len(co2):
+        raise ValueError("all inputs must have one entry per room")
+    on_level, off_level = thresholds.fan_on_co2, thresholds.fan_off_co2
+    states = array("B", fan_on)
+    actions = []
+    for room, level in enumerate(co2):
+        if level >= on_level and not states[room]:
+            states[room] = True
+            actions.append((room, True))
+        elif level < off_level and states[room]:
+            states[room] = False
+            actions.append((room, False))
+    return Decision(states, actions)
@@ -0,0 +1,139 @@
+import mmap
+import os
+import struct
+
+# timestamp, room id, event kind, value
+RECORD = struct.Struct("<dIHxxd")
+
+INDOOR_TEMPERATURE = 1
+OUTDOOR_TEMPERATURE = 2
+CO2 = 3
+OCCUPANCY = 4
+LIGHT = 5
+LED = 6
+SERVO_ANGLE = 7
+FAN = 8
+
+SEGMENT_PREFIX = "events-"
+SEGMENT_SUFFIX = ".log"
+
+
+def segment_number(path: str) -> int:
+    return int(os.path.basename(path)[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)])
+
+
+def segment_paths(directory: str) -> list:
+    names = [name for name in os.listdir(directory)
+             if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX)
+             and name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)].isdigit()]
+    return sorted((os.path.join(directory, name) for name in names), key=segment_number)
+
+
+class EventLogWriter:
+    """Appends fixed-size room event records to rotating segment files.
+
+    Records are packed into an in-memory buffer and written in bulk once
+    ``buffer_records`` are pending. A new segment is started after
+    ``segment_records`` records; its file is only created by the first
+    write into it, so no empty segments are left behind. Numbering
+    continues after the highest existing segment, even if older segments
+    have been pruned.
+    """
+
+    def __init__(self, directory: str, segment_records: int = 1 << 20, buffer_records: int = 4096):
+        if segment_records <= 0 or buffer_records <= 0:
+            raise ValueError("segment_records and buffer_records must be positive")
+        self.directory = directory
+        self.segment_records = segment_records
+        self.buffer_records = buffer_records
+        self._buffer = bytearray(buffer_records * RECORD.size)
+        self._pending = 0
+        os.makedirs(directory, exist_ok=True)
+        existing = segment_paths(directory)
+        self._segment_index = segment_number(existing[-1]) + 1 if existing else 0
+        self._segment_written = 0
+        self._file = None
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def append(self, timestamp: float, room_id: int, kind: int, value: float) -> None:
+        if self._closed:
+            raise ValueError("event log writer is closed")
+        RECORD.pack_into(self._buffer, self._pending * RECORD.size, timestamp, room_id, kind, value)
+        self._pending += 1
+        if self._pending == self.buffer_records or self._segment_written + self._pending == self.segment_records:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        if self._file is None:
+            self._file = self._open_segment()
+        self._file.write(memoryview(self._buffer)[:self._pending * RECORD.size])
+        self._file.flush()
+        self._segment_written += self._pending
+        self._pending = 0
+        if self._segment_written >= self.segment_records:
+            self._file.close()
+            self._file = None
+            self._segment_index += 1
+            self._segment_written = 0
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._closed = True
+
+    def _open_segment(self):
+        name = f"{SEGMENT_PREFIX}{self._segment_index:06d}{SEGMENT_SUFFIX}"
+        return open(os.path.join(self.directory, name), "ab")
+
+
+class EventLogReader:
+    """Reads segments written by EventLogWriter through read-only memory maps."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def segments(self):
+        """Yields each segment as a read-only memoryview of its complete records.
+
+        A partial record left by an interrupted write is ignored. The mapping
+        is closed when the reader moves to the next segment, unless the
+        caller still holds views derived from it (slices, ``cast()``,
+        ``np.frombuffer``): then it stays open and those views stay valid
+        until the last of them is released.
+        """
+        for path in segment_paths(self.directory):
+            with open(path, "rb") as file:
+                size = os.fstat(file.fileno()).st_size
+                size -= size % RECORD.size
+                if size == 0:
+                    continue
+                mapped = mmap.mmap(file.fileno(), size, access=mmap.ACCESS_READ)
+            view = memoryview(mapped)
+            try:
+                yield view
+            finally:
+                try:
+                    view.release()
+                    mapped.close()
+                except BufferError:
+                    # Derived views still export the mapping; it is unmapped once they are gone.
+                    pass
+
+    def records(self, room_id: int = None, kind: int = None):
+        """Yields (timestamp, room_id, kind, value) tuples, optionally filtered."""
+        for view in self.segments():
+            for record in RECORD.iter_unpack(view):
+                if (room_id is None or record[1] == room_id) and (kind is None or record[2] == kind):
+                    yield record
@@ -0,0 +1,81 @@
+import time
+
+
+class Fleet:
+    """Ticks every registered room on a fixed schedule.
+
+    A room is anything with ``manage_light_level``, ``manage_window`` and
+    ``monitor_air_quality`` methods, normally a SmartRoom built with its own
+    pin map. The bound methods are collected once at registration so a tick
+    is a single flat loop. An exception raised by one room is recorded in
+    ``errors`` and does not stop the rest of the fleet.
+    """
+
+    def __init__(self, tick_interval: float = 1.0, clock=time.monotonic, sleep=time.sleep):
+        self.tick_interval = tick_interval
+        self._clock = clock
+        self._sleep = sleep
+        self._rooms = {}
+        self._actions = []
+        self.errors = {}
+        self.ticks = 0
+        self.overruns = 0
+        self.last_tick_seconds = 0.0
+
+    def __len__(self) -> int:
+        return len(self._rooms)
+
+    def register(self, room_id, room) -> None:
+        if room_id in self._rooms:
+            raise ValueError(f"room {room_id!r} already registered")
+        self._rooms[room_id] = room
+        self._actions.append(self._entry(room_id, room))
+
+    def unregister(self, room_id) -> None:
+        del self._rooms[room_id]
+        self.errors.pop(room_id, None)
+        self._rebuild()
+
+    @property
+    def seconds_per_room(self) -> float:
+        """Duration of the last tick divided by the number of rooms."""
+        return self.last_tick_seconds / len(self._rooms) if self._rooms else 0.0
+
+    def tick(self) -> float:
+        start = self._clock()
+        for room_id, light, window, air in self._actions:
+            try:
+                light()
+                window()
+                air()
+            except Exception as error:
+                self.errors[room_id] = error
+        self.last_tick_seconds = self._clock() - start
+        self.ticks += 1
+        return self.last_tick_seconds
+
+    def run(self, ticks: int = None) -> None:
+        """Ticks every ``tick_interval`` seconds, forever or ``ticks`` times.
+
+        A tick that runs past its deadline counts as an overrun and the
+        schedule skips ahead instead of trying to catch up.
+        """
+        deadline = self._clock()
+        done = 0
+        while ticks is None or done < ticks:
+            self.tick()
+            done += 1
+            deadline += self.tick_interval
+            remaining = deadline - self._clock()
+            if remaining > 0:
+                self._sleep(remaining)
+            else:
+                self.overruns += 1
+                deadline = self._clock()
+
+    def _rebuild(self) -> None:
+        self._actions = [self._entry(room_id, room) for room_id, room in self._rooms.items()]
+
+    @staticmethod
+    def _entry(room_id, room) -> tuple:
+        return room_id, room.manage_light_level, room.manage_window, room.monitor_air_quality
@@ -0,0 +1,71 @@
+from array import array
+from itertools import compress
+from operator import ne
+
+from src.decision_engine import DEFAULT_THRESHOLDS, Decision, Thresholds, decide_fan, decide_light, decide_window
+
+RULES = ("light", "window", "fan")
+
+
+class IncrementalEngine:
+    """Runs the batch rules only for rooms whose inputs changed since the last tick.
+
+    The last inputs of every rule are remembered per room. A room whose
+    inputs are exactly equal to the previous tick's is skipped: its state
+    stays as it is and nothing is written. Its result would be the same,
+    because the rules depend only on their inputs and on the state they set
+    themselves. ``evaluated`` and ``skipped`` count rooms per rule.
+    """
+
+    def __init__(self, rooms: int, thresholds: Thresholds = DEFAULT_THRESHOLDS):
+        self.rooms = rooms
+        self.thresholds = thresholds
+        self.light_on = array("B", bytes(rooms))
+        self.window_open = array("B", bytes(rooms))
+        self.fan_on = array("B", bytes(rooms))
+        self._inputs = {rule: None for rule in RULES}
+        self.evaluated = dict.fromkeys(RULES, 0)
+        self.skipped = dict.fromkeys(RULES, 0)
+
+    def skipped_fraction(self, rule: str) -> float:
+        total = self.evaluated[rule] + self.skipped[rule]
+        return self.skipped[rule] / total if total else 0.0
+
+    def light(self, occupied, enough_light) -> Decision:
+        changed, (occupied, enough_light) = self._changed("light", occupied, enough_light)
+        decision = decide_light([self.light_on[room] for room in changed], occupied, enough_light)
+        return self._apply(self.light_on, changed, decision)
+
+    def window(self, indoor, outdoor) -> Decision:
+        changed, (indoor, outdoor) = self._changed("window", indoor, outdoor)
+        decision = decide_window([self.window_open[room] for room in changed], indoor, outdoor, self.thresholds)
+        return self._apply(self.window_open, changed, decision)
+
+    def fan(self, co2) -> Decision:
+        changed, (co2,) = self._changed("fan", co2)
+        decision = decide_fan([self.fan_on[room] for room in changed], co2, self.thresholds)
+        return self._apply(self.fan_on, changed, decision)
+
+    def _changed(self, rule: str, *columns):
+        if any(len(column) != self.rooms for column in columns):
+            raise ValueError("all inputs must have one entry per room")
+        # Snapshot the inputs: callers may update their lists in place.
+        current = [list(column) for column in columns]
+        last, self._inputs[rule] = self._inputs[rule], current
+        if last is None:
+            changed = list(range(self.rooms))
+        else:
+            changed = set()
+            for column, previous in zip(current, last):
+                if column != previous:
+                    changed.update(compress(range(self.rooms), map(ne, column, previous)))
+            changed = sorted(changed)
+        self.evaluated[rule] += len(changed)
+        self.skipped[rule] += self.rooms - len(changed)
+        return changed, [[column[room] for room in changed] for column in current]
+
+    @staticmethod
+    def _apply(states: array, changed: list, decision: Decision) -> Decision:
+        for room, state in zip(changed, decision.states):
+            states[room] = state
+        return Decision(states, [(changed[index], value) for index, value in decision.actions])
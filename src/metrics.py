@@ -0,0 +1,142 @@
+import json
+import os
+import socket
+import time
+from bisect import bisect_left
+
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+
+class Histogram:
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list:
+        total = 0
+        result = []
+        for count in self.counts:
+            total += count
+            result.append(total)
+        return result
+
+
+class _Timer:
+
+    __slots__ = ("_metrics", "_name", "_start")
+
+    def __init__(self, metrics, name):
+        self._metrics = metrics
+        self._name = name
+
+    def __enter__(self):
+        self._start = self._metrics.clock()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._metrics.observe(self._name, self._metrics.clock() - self._start)
+
+
+class _NullTimer:
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Metrics:
+    """Counters and timing histograms for one room or a whole fleet.
+
+    Use ``timer("sense")`` around a phase, ``count("servo_moves")`` for
+    events and ``transition("fan_on", old, new)`` for state changes. When
+    ``enabled`` is False every call returns immediately and ``timer``
+    hands back a shared no-op context manager.
+    """
+
+    def __init__(self, enabled: bool = True, buckets=DEFAULT_BUCKETS, clock=time.perf_counter):
+        self.enabled = enabled
+        self.buckets = tuple(buckets)
+        self.clock = clock
+        self.counters = {}
+        self.histograms = {}
+
+    def count(self, name: str, amount: int = 1) -> None:
+        if not self.enabled:
+            return
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(self, name: str, seconds: float) -> None:
+        if not self.enabled:
+            return
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram(self.buckets)
+        histogram.observe(seconds)
+
+    def transition(self, name: str, old, new) -> None:
+        if self.enabled and old != new:
+            self.count(f"{name}_transitions")
+
+    def timer(self, name: str):
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "counters": self.counters,
+            "histograms": {name: {"buckets": list(histogram.buckets), "counts": histogram.counts,
+                                  "sum": histogram.sum, "count": histogram.count}
+                           for name, histogram in self.histograms.items()},
+        })
+
+    def to_prometheus(self, prefix: str = "smart_room") -> str:
+        lines = []
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {value}")
+        for name, histogram in sorted(self.histograms.items()):
+            metric = f"{prefix}_{name}_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            bounds = [repr(bound) for bound in histogram.buckets] + ["+Inf"]
+            for bound, count in zip(bounds, histogram.cumulative()):
+                lines.append(f'{metric}_bucket{{le="{bound}"}} {count}')
+            lines.append(f"{metric}_sum {histogram.sum!r}")
+            lines.append(f"{metric}_count {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def render(self, fmt: str) -> str:
+        if fmt == "json":
+            return self.to_json()
+        if fmt == "prometheus":
+            return self.to_prometheus()
+        raise ValueError(f"unknown format {fmt!r}")
+
+    def export(self, path: str, fmt: str = "prometheus") -> None:
+        """Writes the metrics to ``path``, replacing it atomically."""
+        temporary = f"{path}.tmp"
+        with open(temporary, "w") as file:
+            file.write(self.render(fmt))
+        os.replace(temporary, path)
+
+    def send(self, address: tuple, fmt: str = "prometheus", timeout: float = 1.0) -> None:
+        """Sends the metrics to a local collector listening on ``address``."""
+        with socket.create_connection(address, timeout=timeout) as connection:
+            connection.sendall(self.render(fmt).encode())
@@ -0,0 +1,87 @@
+LIGHT_ON = 1
+WINDOW_OPEN = 2
+FAN_ON = 4
+
+
+class RoomStateStore:
+    """Actuator state of many rooms, one byte per room with a bit per actuator."""
+
+    def __init__(self, capacity: int = 0):
+        self._flags = bytearray(capacity)
+
+    def __len__(self) -> int:
+        return len(self._flags)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._flags)
+
+    def add_room(self) -> "RoomState":
+        self._flags.append(0)
+        return RoomState(self, len(self._flags) - 1)
+
+    def room(self, index: int) -> "RoomState":
+        if not 0 <= index < len(self._flags):
+            raise IndexError(f"no room at index {index}")
+        return RoomState(self, index)
+
+    def get(self, index: int, flag: int) -> bool:
+        return bool(self._flags[index] & flag)
+
+    def set(self, index: int, flag: int, value: bool) -> None:
+        if value:
+            self._flags[index] |= flag
+        else:
+            self._flags[index] &= ~flag
+
+    def count(self, flag: int) -> int:
+        return sum(1 for flags in self._flags if flags & flag)
+
+
+def _flag_property(flag: int) -> property:
+    def getter(self) -> bool:
+        return self._store.get(self._index, flag)
+
+    def setter(self, value: bool) -> None:
+        self._store.set(self._index, flag, value)
+
+    return property(getter, setter)
+
+
+class RoomState:
+    """Slotted view of one room in a RoomStateStore.
+
+    Exposes ``light_on``, ``window_open`` and ``fan_on`` like the SmartRoom
+    attributes of the same names.
+    """
+
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: RoomStateStore, index: int):
+        self._store = store
+        self._index = index
+
+    light_on = _flag_property(LIGHT_ON)
+    window_open = _flag_property(WINDOW_OPEN)
+    fan_on = _flag_property(FAN_ON)
+
+
+class DevicePool:
+    """Hands out one shared device per key instead of one per room.
+
+    ``get(Adafruit_BMP280_I2C, bus, 0x76)`` constructs the device the first
+    time and returns the same instance for every later room on that bus
+    address.
+    """
+
+    def __init__(self):
+        self._devices = {}
+
+    def __len__(self) -> int:
+        return len(self._devices)
+
+    def get(self, factory, *key):
+        device = self._devices.get((factory, key))
+        if device is None:
+            device = self._devices[(factory, key)] = factory(*key)
+        return device
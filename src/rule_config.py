@@ -0,0 +1,124 @@
+from typing import NamedTuple
+
+from src.decision_engine import DEFAULT_THRESHOLDS, Thresholds
+
+SECTIONS = {"defaults", "zones", "rooms"}
+
+
+class RoomRules(NamedTuple):
+    """Compiled rules of one room, with the thresholds bound into closures.
+
+    ``light(occupied, enough_light)`` returns the LED value.
+    ``window(indoor, outdoor)`` returns the servo angle to write, or None.
+    ``fan(fan_on, co2)`` returns the fan value to write, or None.
+    """
+    thresholds: Thresholds
+    light: object
+    window: object
+    fan: object
+
+
+def _light(occupied, enough_light) -> bool:
+    return bool(occupied) and not enough_light
+
+
+def compile_rules(thresholds: Thresholds) -> RoomRules:
+    low, high, gap = thresholds.min_temperature, thresholds.max_temperature, thresholds.temperature_gap
+    open_angle, closed_angle = thresholds.open_angle, thresholds.closed_angle
+    on_level, off_level = thresholds.fan_on_co2, thresholds.fan_off_co2
+
+    def window(indoor, outdoor):
+        if low <= indoor <= high and low <= outdoor <= high:
+            if outdoor - indoor > gap:
+                return open_angle
+            if indoor - outdoor > gap:
+                return closed_angle
+            return None
+        return closed_angle
+
+    def fan(fan_on, co2):
+        if co2 >= on_level and not fan_on:
+            return True
+        if co2 < off_level and fan_on:
+            return False
+        return None
+
+    return RoomRules(thresholds, _light, window, fan)
+
+
+def _thresholds(base: Thresholds, overrides: dict, where: str) -> Thresholds:
+    unknown = overrides.keys() - set(Thresholds._fields)
+    if unknown:
+        raise ValueError(f"{where}: unknown keys {sorted(unknown)}")
+    thresholds = base._replace(**overrides)
+    if thresholds.min_temperature > thresholds.max_temperature:
+        raise ValueError(f"{where}: min_temperature is above max_temperature")
+    if thresholds.temperature_gap < 0:
+        raise ValueError(f"{where}: temperature_gap must not be negative")
+    if thresholds.fan_off_co2 > thresholds.fan_on_co2:
+        raise ValueError(f"{where}: fan_off_co2 is above fan_on_co2")
+    return thresholds
+
+
+class CompiledConfig:
+    """A rule configuration resolved into compiled rules per room.
+
+    The configuration is a mapping with optional ``defaults``, ``zones`` and
+    ``rooms`` sections, each holding Thresholds field names::
+
+        {"defaults": {"fan_on_co2": 900},
+         "zones": {"lab": {"max_temperature": 26}},
+         "rooms": {"101": {"zone": "lab", "open_angle": 15}}}
+
+    A room takes its own values over its zone's over the defaults over
+    DEFAULT_THRESHOLDS. Rooms with equal thresholds share one RoomRules.
+    Invalid configurations raise ValueError.
+    """
+
+    def __init__(self, config: dict):
+        unknown = config.keys() - SECTIONS
+        if unknown:
+            raise ValueError(f"unknown sections {sorted(unknown)}")
+        defaults = _thresholds(DEFAULT_THRESHOLDS, config.get("defaults", {}), "defaults")
+        compiled = {}
+
+        def rules(thresholds: Thresholds) -> RoomRules:
+            if thresholds not in compiled:
+                compiled[thresholds] = compile_rules(thresholds)
+            return compiled[thresholds]
+
+        zones = {name: _thresholds(defaults, values, f"zone {name}")
+                 for name, values in config.get("zones", {}).items()}
+        self._rooms = {}
+        for room, values in config.get("rooms", {}).items():
+            values = dict(values)
+            zone = values.pop("zone", None)
+            if zone is not None and zone not in zones:
+                raise ValueError(f"room {room}: unknown zone {zone!r}")
+            base = defaults if zone is None else zones[zone]
+            self._rooms[str(room)] = rules(_thresholds(base, values, f"room {room}"))
+        self.zones = {name: rules(thresholds) for name, thresholds in zones.items()}
+        self.defaults = rules(defaults)
+
+    def room(self, room) -> RoomRules:
+        return self._rooms.get(str(room), self.defaults)
+
+
+class RuleSet:
+    """Holds the current CompiledConfig and swaps it on reload.
+
+    ``reload`` compiles the new configuration before replacing the
+    reference in a single assignment, so a control loop that reads
+    ``current`` once per tick never waits and never sees a half-built
+    configuration. If compilation fails the old configuration stays.
+    """
+
+    def __init__(self, config: dict = None):
+        self.current = CompiledConfig(config or {})
+        self.reloads = 0
+
+    def reload(self, config: dict) -> CompiledConfig:
+        compiled = CompiledConfig(config)
+        self.current = compiled
+        self.reloads += 1
+        return compiled
@@ -0,0 +1,59 @@
+import time
+
+
+class CachedReading:
+    """Caches the result of a slow sensor read for ``ttl`` seconds.
+
+    ``read`` is any zero-argument callable, e.g. ``co2_sensor.co2`` or
+    ``lambda: bmp280_indor.temperature``. A failed read is not cached.
+    """
+
+    def __init__(self, read, ttl: float, clock=time.monotonic):
+        if ttl < 0:
+            raise ValueError("ttl must not be negative")
+        self._read = read
+        self.ttl = ttl
+        self._clock = clock
+        self._value = None
+        self._expires = None
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self):
+        now = self._clock()
+        if self._expires is not None and now < self._expires:
+            self.hits += 1
+            return self._value
+        self.misses += 1
+        self._value = self._read()
+        self._expires = now + self.ttl
+        return self._value
+
+    def invalidate(self) -> None:
+        self._expires = None
+
+
+class SensorCache:
+    """A named group of cached readings with per-sensor TTLs."""
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._readings = {}
+
+    def add(self, name: str, read, ttl: float) -> CachedReading:
+        reading = CachedReading(read, ttl, self._clock)
+        self._readings[name] = reading
+        return reading
+
+    def read(self, name: str):
+        return self._readings[name]()
+
+    def invalidate(self, name: str = None) -> None:
+        """Drops the cached value of ``name``, or of every sensor if ``name`` is None."""
+        readings = self._readings.values() if name is None else [self._readings[name]]
+        for reading in readings:
+            reading.invalidate()
+
+    def stats(self) -> dict:
+        return {name: {"hits": reading.hits, "misses": reading.misses}
+                for name, reading in self._readings.items()}
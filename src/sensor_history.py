@@ -0,0 +1,88 @@
+from array import array
+
+
+class RingBuffer:
+    """Fixed-size history of the last ``capacity`` samples of one sensor.
+
+    Every sample is written twice, at ``i`` and ``i + capacity``, so the last
+    ``n`` samples always sit in one contiguous slice of the backing array and
+    can be returned as a memoryview without copying. ``min``, ``max`` and
+    ``mean`` use the builtins over that view, which still iterate element by
+    element; they are not vectorized (NumPy is not a dependency).
+    """
+
+    def __init__(self, capacity: int, typecode: str = "d"):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._data = array(typecode, bytes(2 * capacity * array(typecode).itemsize))
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.itemsize * len(self._data)
+
+    def append(self, value) -> None:
+        self._data[self._head] = value
+        self._data[self._head + self.capacity] = value
+        self._head = (self._head + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def window(self, n: int = None) -> memoryview:
+        """Returns the last ``n`` samples (all of them if ``n`` is None), oldest first."""
+        if n is not None and n < 0:
+            raise ValueError("n must not be negative")
+        n = self._count if n is None else min(n, self._count)
+        end = self._head + self.capacity
+        return memoryview(self._data)[end - n:end]
+
+    def min(self, n: int = None):
+        return min(self._non_empty_window(n))
+
+    def max(self, n: int = None):
+        return max(self._non_empty_window(n))
+
+    def mean(self, n: int = None) -> float:
+        view = self._non_empty_window(n)
+        return sum(view) / len(view)
+
+    def _non_empty_window(self, n: int) -> memoryview:
+        view = self.window(n)
+        if len(view) == 0:
+            raise ValueError("no samples recorded")
+        return view
+
+
+class SensorHistory:
+    """Bounded per-room history of the readings taken by SmartRoom."""
+
+    DEFAULT_CAPACITY = 128
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.indoor_temperature = RingBuffer(capacity, "d")
+        self.outdoor_temperature = RingBuffer(capacity, "d")
+        # The S8 reports whole ppm, which float32 stores exactly.
+        self.co2 = RingBuffer(capacity, "f")
+        self.occupancy = RingBuffer(capacity, "B")
+        self.light = RingBuffer(capacity, "B")
+
+    @property
+    def nbytes(self) -> int:
+        return (self.indoor_temperature.nbytes + self.outdoor_temperature.nbytes + self.co2.nbytes
+                + self.occupancy.nbytes + self.light.nbytes)
+
+    def record_temperatures(self, indoor: float, outdoor: float) -> None:
+        self.indoor_temperature.append(indoor)
+        self.outdoor_temperature.append(outdoor)
+
+    def record_co2(self, co2: int) -> None:
+        self.co2.append(co2)
+
+    def record_light_inputs(self, occupied: bool, enough_light: bool) -> None:
+        self.occupancy.append(occupied)
+        self.light.append(enough_light)
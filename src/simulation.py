@@ -0,0 +1,70 @@
+from typing import NamedTuple
+
+from src.decision_engine import DEFAULT_THRESHOLDS, Thresholds, decide_fan, decide_light, decide_window
+
+
+class Sample(NamedTuple):
+    """Readings of every room at one simulated instant, one entry per room."""
+    indoor: list
+    outdoor: list
+    co2: list
+    occupied: list
+    enough_light: list
+
+
+class Event(NamedTuple):
+    time: float
+    room: int
+    actuator: str
+    value: bool
+
+
+class Timeline(NamedTuple):
+    """State changes of every room, the final states and the raw write counts."""
+    events: list
+    light_on: list
+    window_open: list
+    fan_on: list
+    writes: dict
+
+
+def samples_from_traces(indoor, outdoor, co2, occupied, enough_light):
+    """Turns per-room traces (one sequence or generator per room) into per-step samples.
+
+    The simulation stops at the end of the shortest trace.
+    """
+    columns = [zip(*trace) for trace in (indoor, outdoor, co2, occupied, enough_light)]
+    for values in zip(*columns):
+        yield Sample(*values)
+
+
+def simulate(samples, rooms: int, interval: float = 1.0, thresholds: Thresholds = DEFAULT_THRESHOLDS,
+             start: float = 0.0) -> Timeline:
+    """Runs the control rules of ``rooms`` rooms over ``samples``, ``interval`` simulated seconds apart.
+
+    Every room starts with light, window and fan off. No real time passes:
+    each step is one batch call per rule.
+    """
+    light_on = [False] * rooms
+    window_open = [False] * rooms
+    fan_on = [False] * rooms
+    events = []
+    writes = {"light": 0, "window": 0, "fan": 0}
+    time = start
+    for sample in samples:
+        light = decide_light(light_on, sample.occupied, sample.enough_light)
+        window = decide_window(window_open, sample.indoor, sample.outdoor, thresholds)
+        fan = decide_fan(fan_on, sample.co2, thresholds)
+        writes["light"] += len(light.actions)
+        writes["window"] += len(window.actions)
+        writes["fan"] += len(fan.actions)
+        for name, states, decision in (("light_on", light_on, light), ("window_open", window_open, window),
+                                       ("fan_on", fan_on, fan)):
+            # A state can only change where the rule issued a write.
+            for room, _ in decision.actions:
+                value = decision.states[room]
+                if bool(value) != states[room]:
+                    states[room] = bool(value)
+                    events.append(Event(time, room, name, bool(value)))
+        time += interval
+    return Timeline(events, light_on, window_open, fan_on, writes)
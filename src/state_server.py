@@ -0,0 +1,181 @@
+import asyncio
+import base64
+import hashlib
+import json
+import struct
+
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+MAX_HEADER_BYTES = 16 * 1024
+MAX_CLIENT_FRAME_BYTES = 64 * 1024
+# A subscriber whose unsent data grows past this is too slow and gets dropped.
+MAX_SUBSCRIBER_BUFFER = 1024 * 1024
+
+OPCODE_TEXT = 0x1
+OPCODE_CLOSE = 0x8
+OPCODE_PING = 0x9
+OPCODE_PONG = 0xA
+
+
+def websocket_frame(payload: bytes, opcode: int = OPCODE_TEXT) -> bytes:
+    """Builds one unmasked server-to-client frame."""
+    length = len(payload)
+    if length < 126:
+        header = struct.pack("!BB", 0x80 | opcode, length)
+    elif length < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+    return header + payload
+
+
+def state_diff(old: dict, new: dict) -> dict:
+    """Changed fields per room; a room that disappeared maps to None."""
+    diff = {}
+    for room, fields in new.items():
+        previous = old.get(room, {})
+        changed = {name: value for name, value in fields.items() if previous.get(name) != value}
+        if changed:
+            diff[room] = changed
+    for room in old.keys() - new.keys():
+        diff[room] = None
+    return diff
+
+
+class StateServer:
+    """Local HTTP and WebSocket server for room state.
+
+    ``GET /state`` returns every room, ``GET /rooms/<id>`` one room and
+    ``GET /rooms/<id>/history`` whatever ``history(room_id)`` returns. HTTP
+    connections are kept alive between requests. ``GET /subscribe`` upgrades
+    to a WebSocket that first receives the full state and then only diffs.
+    ``publish`` is called once per tick; each diff is serialized and framed
+    once and the same bytes are written to every subscriber.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, history=None):
+        self.host = host
+        self.port = port
+        self._history = history
+        self._state = {}
+        self._server = None
+        self._subscribers = set()
+        self.serializations = 0
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscribers)
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        for writer in list(self._subscribers):
+            writer.close()
+        self._subscribers.clear()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def publish(self, state: dict) -> dict:
+        """Replaces the state and pushes the diff to every subscriber; returns the diff."""
+        state = {str(room): dict(fields) for room, fields in state.items()}
+        diff = state_diff(self._state, state)
+        self._state = state
+        if diff and self._subscribers:
+            frame = websocket_frame(self._serialize(diff))
+            for writer in list(self._subscribers):
+                if writer.transport.get_write_buffer_size() > MAX_SUBSCRIBER_BUFFER:
+                    self._subscribers.discard(writer)
+                    writer.close()
+                else:
+                    writer.write(frame)
+        return diff
+
+    def _serialize(self, data) -> bytes:
+        self.serializations += 1
+        return json.dumps(data, separators=(",", ":")).encode()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    request = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                if len(request) > MAX_HEADER_BYTES:
+                    return
+                method, path, version, headers = self._parse(request)
+                if method == "GET" and path == "/subscribe" and headers.get("upgrade", "").lower() == "websocket":
+                    await self._subscribe(reader, writer, headers)
+                    return
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                status, body = self._route(method, path)
+                writer.write(
+                    f"{version} {status}\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(body)}\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                    .encode() + body)
+                await writer.drain()
+                if not keep_alive:
+                    return
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _parse(request: bytes):
+        lines = request.decode("latin-1").split("\r\n")
+        method, path, version = (lines[0].split(" ", 2) + ["", ""])[:3]
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            if name:
+                headers[name.strip().lower()] = value.strip()
+        return method, path, version or "HTTP/1.0", headers
+
+    def _route(self, method: str, path: str):
+        if method != "GET":
+            return "405 Method Not Allowed", self._serialize({"error": "method not allowed"})
+        parts = path.strip("/").split("/")
+        if parts == ["state"]:
+            return "200 OK", self._serialize(self._state)
+        if len(parts) >= 2 and parts[0] == "rooms" and parts[1] in self._state:
+            if len(parts) == 2:
+                return "200 OK", self._serialize(self._state[parts[1]])
+            if parts[2:] == ["history"] and self._history is not None:
+                return "200 OK", self._serialize(self._history(parts[1]))
+        return "404 Not Found", self._serialize({"error": "not found"})
+
+    async def _subscribe(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, headers: dict) -> None:
+        key = headers.get("sec-websocket-key", "")
+        accept = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode()).digest()).decode()
+        writer.write(("HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                      f"Sec-WebSocket-Accept: {accept}\r\n\r\n").encode())
+        writer.write(websocket_frame(self._serialize(self._state)))
+        self._subscribers.add(writer)
+        try:
+            while True:
+                opcode, payload = await self._read_frame(reader)
+                if opcode == OPCODE_CLOSE:
+                    writer.write(websocket_frame(payload[:2], OPCODE_CLOSE))
+                    return
+                if opcode == OPCODE_PING:
+                    writer.write(websocket_frame(payload, OPCODE_PONG))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return
+        finally:
+            self._subscribers.discard(writer)
+
+    @staticmethod
+    async def _read_frame(reader: asyncio.StreamReader):
+        first, second = await reader.readexactly(2)
+        length = second & 0x7F
+        if length == 126:
+            length, = struct.unpack("!H", await reader.readexactly(2))
+        elif length == 127:
+            length, = struct.unpack("!Q", await reader.readexactly(8))
+        if length > MAX_CLIENT_FRAME_BYTES:
+            raise ConnectionError("client frame too large")
+        mask = await reader.readexactly(4) if second & 0x80 else bytes(4)
+        payload = await reader.readexactly(length)
+        return first & 0x0F, bytes(byte ^ mask[index % 4] for index, byte in enumerate(payload))
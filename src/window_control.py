@@ -0,0 +1,92 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.decision_engine import DEFAULT_THRESHOLDS, Thresholds
+
+
+class WindowController:
+    """Window rule with hysteresis bands, a minimum dwell time and optional non-blocking moves.
+
+    A closed window opens only when both temperatures are at least
+    ``hysteresis`` inside the range and outdoor exceeds indoor by more than
+    the gap plus ``hysteresis``. An open window closes only when a
+    temperature leaves the range by more than ``hysteresis`` or indoor
+    exceeds outdoor by more than the gap plus ``hysteresis``. No move is
+    made within ``min_dwell`` seconds of the previous one, and the servo is
+    never re-commanded to the position it already holds.
+
+    ``move(angle)`` drives the servo, like SmartRoom.change_servo_angle. With
+    ``blocking=False`` it runs on a background thread so ``update`` returns
+    at once; decisions are skipped while a move is in progress, and an error
+    raised by the move is re-raised by the next ``update``.
+    """
+
+    def __init__(self, move, hysteresis: float = 0.5, min_dwell: float = 60.0, blocking: bool = True,
+                 thresholds: Thresholds = DEFAULT_THRESHOLDS, clock=time.monotonic):
+        self._move = move
+        self.hysteresis = hysteresis
+        self.min_dwell = min_dwell
+        self.blocking = blocking
+        self.thresholds = thresholds
+        self._clock = clock
+        self._executor = None
+        self._pending = None
+        self._last_move = None
+        self.window_open = False
+        self.moves = 0
+
+    @property
+    def moving(self) -> bool:
+        return self._pending is not None and not self._pending.done()
+
+    def update(self, indoor: float, outdoor: float):
+        """Applies the rule to one reading and returns the commanded angle, or None."""
+        if self.moving:
+            return None
+        self._collect()
+        target = self._target(indoor, outdoor)
+        if target is None or target == self.window_open:
+            return None
+        now = self._clock()
+        if self._last_move is not None and now - self._last_move < self.min_dwell:
+            return None
+        angle = self.thresholds.open_angle if target else self.thresholds.closed_angle
+        if self.blocking:
+            self._move(angle)
+        else:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+            self._pending = self._executor.submit(self._move, angle)
+        self.window_open = target
+        self._last_move = now
+        self.moves += 1
+        return angle
+
+    def wait(self) -> None:
+        """Blocks until a non-blocking move has finished, re-raising its error."""
+        if self._pending is not None:
+            self._pending.exception()
+        self._collect()
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _collect(self) -> None:
+        pending, self._pending = self._pending, None
+        if pending is not None and pending.exception() is not None:
+            self.window_open = not self.window_open
+            raise pending.exception()
+
+    def _target(self, indoor: float, outdoor: float):
+        margin = self.hysteresis
+        low, high = self.thresholds.min_temperature, self.thresholds.max_temperature
+        gap = self.thresholds.temperature_gap + margin
+        if self.window_open:
+            outside_range = any(value < low - margin or value > high + margin for value in (indoor, outdoor))
+            if outside_range or indoor - outdoor > gap:
+                return False
+        elif all(low + margin <= value <= high - margin for value in (indoor, outdoor)) and outdoor - indoor > gap:
+            return True
+        return None
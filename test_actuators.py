@@ -0,0 +1,101 @@
+import unittest
+from unittest.mock import Mock, call
+
+from src.actuators import ActuatorBank
+
+LED_PIN = 18
+FAN_PIN = 6
+WINDOW = "window"
+
+
+class TestActuatorBank(unittest.TestCase):
+
+    def setUp(self):
+        self.write_pin = Mock()
+        self.write_servo = Mock()
+        self.bank = ActuatorBank(self.write_pin, self.write_servo)
+
+    def test_first_command_is_written(self):
+        self.bank.set_pin(LED_PIN, True)
+        self.bank.set_servo(WINDOW, 12)
+
+        self.assertEqual(2, self.bank.flush())
+        self.write_pin.assert_called_once_with(LED_PIN, True)
+        self.write_servo.assert_called_once_with(WINDOW, 12)
+        self.assertTrue(self.bank.pin_state(LED_PIN))
+        self.assertEqual(12, self.bank.servo_state(WINDOW))
+
+    def test_repeated_command_not_written(self):
+        self.bank.set_pin(LED_PIN, False)
+        self.bank.set_servo(WINDOW, 2)
+        self.bank.flush()
+        self.write_pin.reset_mock()
+        self.write_servo.reset_mock()
+
+        self.bank.set_pin(LED_PIN, False)
+        self.bank.set_servo(WINDOW, 2)
+
+        self.assertEqual(0, self.bank.flush())
+        self.write_pin.assert_not_called()
+        self.write_servo.assert_not_called()
+        self.assertEqual(2, self.bank.skipped)
+
+    def test_nothing_written_before_flush(self):
+        self.bank.set_pin(LED_PIN, True)
+
+        self.write_pin.assert_not_called()
+
+    def test_only_last_command_per_tick_written(self):
+        self.bank.set_pin(FAN_PIN, True)
+        self.bank.set_pin(FAN_PIN, False)
+        self.bank.set_pin(LED_PIN, True)
+
+        self.bank.flush()
+
+        self.write_pin.assert_has_calls([call(FAN_PIN, False), call(LED_PIN, True)])
+        self.assertEqual(2, self.write_pin.call_count)
+
+    def test_change_reverted_before_flush_is_dropped(self):
+        self.bank.set_pin(FAN_PIN, False)
+        self.bank.flush()
+        self.write_pin.reset_mock()
+
+        self.bank.set_pin(FAN_PIN, True)
+        self.bank.set_pin(FAN_PIN, False)
+
+        self.assertEqual(0, self.bank.flush())
+        self.write_pin.assert_not_called()
+
+    def test_force_resync_rewrites_every_known_state(self):
+        self.bank.set_pin(LED_PIN, True)
+        self.bank.set_pin(FAN_PIN, False)
+        self.bank.set_servo(WINDOW, 2)
+        self.bank.flush()
+        self.write_pin.reset_mock()
+        self.write_servo.reset_mock()
+
+        self.bank.force_resync()
+        self.bank.set_pin(LED_PIN, True)
+
+        self.assertEqual(3, self.bank.flush())
+        self.write_pin.assert_has_calls([call(LED_PIN, True), call(FAN_PIN, False)], any_order=True)
+        self.write_servo.assert_called_once_with(WINDOW, 2)
+
+    def test_force_resync_keeps_pending_changes(self):
+        self.bank.set_pin(LED_PIN, True)
+        self.bank.flush()
+        self.bank.set_pin(LED_PIN, False)
+
+        self.bank.force_resync()
+        self.bank.flush()
+
+        self.write_pin.assert_called_with(LED_PIN, False)
+        self.assertFalse(self.bank.pin_state(LED_PIN))
+
+    def test_write_counter(self):
+        for value in [True, True, False, False]:
+            self.bank.set_pin(LED_PIN, value)
+            self.bank.flush()
+
+        self.assertEqual(2, self.bank.writes)
+        self.assertEqual(2, self.bank.skipped)
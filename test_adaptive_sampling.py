@@ -0,0 +1,105 @@
+import math
+import random
+import unittest
+
+from src.adaptive_sampling import (AdaptiveSampler, co2_time_to_threshold, time_to_threshold,
+                                   window_time_to_threshold)
+from src.decision_engine import decide_fan, decide_window
+
+
+def wave(center, amplitude, period, noise, steps, seed):
+    """Slow sine plus sensor noise; changes by at most amplitude / period + 2 * noise per tick."""
+    rng = random.Random(seed)
+    return [center + amplitude * math.sin(tick / period) + rng.uniform(-noise, noise) for tick in range(steps)]
+
+
+class TestTimeToThreshold(unittest.TestCase):
+
+    def test_nearest_threshold_wins(self):
+        self.assertEqual(5.0, time_to_threshold(750, (500, 800), 10))
+
+    def test_co2_thresholds(self):
+        self.assertEqual(0.0, co2_time_to_threshold(800, 5))
+        self.assertEqual(20.0, co2_time_to_threshold(600, 5))
+
+    def test_window_gap_changes_twice_as_fast(self):
+        # 2.5 C from the range bounds, but the gap of 1 is 1 C away from 2.
+        self.assertEqual(5.0, window_time_to_threshold(21, 22, 0.1))
+
+    def test_rate_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            time_to_threshold(600, (500,), 0)
+
+
+class TestAdaptiveSampler(unittest.TestCase):
+
+    def test_interval_in_whole_ticks_between_bounds(self):
+        sampler = AdaptiveSampler(base_interval=2.0, max_ticks=10)
+
+        self.assertEqual(1, sampler.record(0, 0.5))
+        self.assertEqual(3, sampler.record(1, 7.9))
+        self.assertEqual(10, sampler.record(4, 1000))
+        self.assertEqual(14, sampler.next_tick)
+        self.assertEqual(3, sampler.reads)
+
+    def test_due(self):
+        sampler = AdaptiveSampler()
+        sampler.record(0, 5)
+
+        self.assertFalse(sampler.due(4))
+        self.assertTrue(sampler.due(5))
+
+    def test_fan_changes_match_fixed_rate_loop(self):
+        co2 = wave(650, 300, 200, 5, 5000, seed=1)
+        max_rate = 300 / 200 + 2 * 5
+
+        fixed = []
+        fan_on = [False]
+        for tick, level in enumerate(co2):
+            decision = decide_fan(fan_on, [level])
+            fan_on = list(decision.states)
+            fixed += [(tick, value) for _, value in decision.actions]
+
+        adaptive = []
+        sampler = AdaptiveSampler()
+        fan_on = [False]
+        for tick, level in enumerate(co2):
+            if sampler.due(tick):
+                sampler.record(tick, co2_time_to_threshold(level, max_rate))
+                decision = decide_fan(fan_on, [level])
+                fan_on = list(decision.states)
+                adaptive += [(tick, value) for _, value in decision.actions]
+
+        self.assertTrue(fixed)
+        self.assertEqual(fixed, adaptive)
+        self.assertLess(sampler.reads, len(co2) / 3)
+
+    def test_window_changes_match_fixed_rate_loop(self):
+        indoor = wave(24, 7, 400, 0.01, 5000, seed=2)
+        outdoor = wave(25, 9, 250, 0.01, 5000, seed=3)
+        max_rate = 9 / 250 + 2 * 0.01
+
+        def changes(read_at):
+            result = []
+            window_open = [False]
+            for tick, (inside, outside) in enumerate(zip(indoor, outdoor)):
+                if read_at(tick, inside, outside):
+                    decision = decide_window(window_open, [inside], [outside])
+                    if bool(decision.states[0]) != window_open[0]:
+                        result.append((tick, bool(decision.states[0])))
+                    window_open = list(decision.states)
+            return result
+
+        sampler = AdaptiveSampler()
+
+        def adaptive(tick, inside, outside):
+            if not sampler.due(tick):
+                return False
+            sampler.record(tick, window_time_to_threshold(inside, outside, max_rate))
+            return True
+
+        fixed = changes(lambda tick, inside, outside: True)
+
+        self.assertTrue(fixed)
+        self.assertEqual(fixed, changes(adaptive))
+        self.assertLess(sampler.reads, len(indoor) / 3)
@@ -0,0 +1,107 @@
+import unittest
+
+from src.anomaly_detection import SensorGuard
+
+
+class TestSensorGuard(unittest.TestCase):
+
+    def feed(self, guard: SensorGuard, values):
+        return [guard.update(value) for value in values]
+
+    def test_good_readings_pass_through(self):
+        guard = SensorGuard()
+
+        self.assertEqual([600, 610, 605], self.feed(guard, [600, 610, 605]))
+        self.assertFalse(guard.quarantined)
+        self.assertEqual(0, guard.faults)
+
+    def test_single_spike_replaced_by_last_good_reading(self):
+        guard = SensorGuard(warmup=5, min_deviation=50)
+        self.feed(guard, [600, 602, 598, 601, 599, 600])
+
+        self.assertEqual(600, guard.update(1500))
+        self.assertEqual(1, guard.faults)
+        self.assertFalse(guard.quarantined)
+        self.assertEqual(603, guard.update(603))
+
+    def test_no_spike_detection_during_warmup(self):
+        guard = SensorGuard(warmup=5, min_deviation=50)
+
+        self.assertEqual([600, 1500], self.feed(guard, [600, 1500]))
+
+    def test_missing_reading_falls_back_to_last_good(self):
+        guard = SensorGuard()
+        guard.update(21.5)
+
+        self.assertEqual(21.5, guard.update(None))
+        self.assertEqual(21.5, guard.update(float("nan")))
+        self.assertEqual(2, guard.faults)
+
+    def test_no_fallback_before_first_good_reading(self):
+        guard = SensorGuard()
+
+        self.assertIsNone(guard.update(None))
+
+    def test_out_of_range_reading_is_faulty(self):
+        guard = SensorGuard(min_value=-40, max_value=85)
+        guard.update(22)
+
+        self.assertEqual(22, guard.update(120))
+        self.assertEqual(22, guard.update(-50))
+        self.assertEqual(2, guard.faults)
+
+    def test_stable_feed_never_quarantined(self):
+        guard = SensorGuard()
+
+        results = self.feed(guard, [600] * 1000 + [600, 601, 600, 599] * 250)
+
+        self.assertEqual(0, guard.faults)
+        self.assertFalse(guard.quarantined)
+        self.assertEqual(599, results[-1])
+
+    def test_stuck_detection_off_by_default(self):
+        self.assertIsNone(SensorGuard().stuck_after)
+
+    def test_stuck_sensor_quarantined(self):
+        guard = SensorGuard(stuck_after=4, quarantine_after=2)
+
+        results = self.feed(guard, [21, 21, 21, 21, 21])
+
+        self.assertEqual([21, 21, 21, 21, 21], results)
+        self.assertEqual(2, guard.faults)
+        self.assertTrue(guard.quarantined)
+
+    def test_quarantine_after_consecutive_faults(self):
+        guard = SensorGuard(quarantine_after=3)
+        guard.update(500)
+
+        self.feed(guard, [None, None])
+        self.assertFalse(guard.quarantined)
+        guard.update(None)
+        self.assertTrue(guard.quarantined)
+
+    def test_release_after_consecutive_good_readings(self):
+        guard = SensorGuard(quarantine_after=1, release_after=3)
+        guard.update(500)
+        guard.update(None)
+
+        self.assertEqual([500, 500], self.feed(guard, [510, 520]))
+        self.assertTrue(guard.quarantined)
+        self.assertEqual(530, guard.update(530))
+        self.assertFalse(guard.quarantined)
+
+    def test_fault_resets_release_count(self):
+        guard = SensorGuard(quarantine_after=1, release_after=2)
+        guard.update(500)
+        self.feed(guard, [None, 510, None, 520])
+
+        self.assertTrue(guard.quarantined)
+
+    def test_sustained_level_shift_relearned(self):
+        guard = SensorGuard(warmup=5, min_deviation=50, quarantine_after=3, release_after=3)
+        self.feed(guard, [600, 601, 599, 600, 602, 600])
+
+        results = self.feed(guard, [900, 901, 899, 900, 902, 901])
+
+        self.assertEqual([600, 600, 600, 600, 600, 901], results)
+        self.assertFalse(guard.quarantined)
@@ -0,0 +1,98 @@
+from array import array
+import unittest
+from unittest.mock import Mock
+
+from src.backends import FAN_PIN, INFRARED_PIN, LED_PIN, PHOTO_PIN, DriverBackend, InMemoryBackend
+from src.decision_engine import decide_fan, decide_light, decide_window
+
+
+def manage_light_level(backend) -> bool:
+    light_on = bool(backend.input(INFRARED_PIN) and not backend.input(PHOTO_PIN))
+    backend.output(LED_PIN, light_on)
+    return light_on
+
+
+class TestDriverBackend(unittest.TestCase):
+
+    def test_delegates_to_drivers(self):
+        gpio = Mock()
+        gpio.input.return_value = True
+        indoor, outdoor, co2_sensor = Mock(temperature=21.0), Mock(temperature=24.5), Mock()
+        co2_sensor.co2.return_value = 650
+        backend = DriverBackend(gpio, indoor, outdoor, co2_sensor)
+
+        backend.output(FAN_PIN, True)
+
+        self.assertTrue(backend.input(INFRARED_PIN))
+        gpio.input.assert_called_once_with(INFRARED_PIN)
+        gpio.output.assert_called_once_with(FAN_PIN, True)
+        self.assertEqual(21.0, backend.indoor_temperature())
+        self.assertEqual(24.5, backend.outdoor_temperature())
+        self.assertEqual(650, backend.co2())
+
+    def test_rooms_do_not_share_devices(self):
+        first = DriverBackend(Mock(), Mock(temperature=20.0), Mock(), Mock())
+        second = DriverBackend(Mock(), Mock(temperature=26.0), Mock(), Mock())
+
+        self.assertEqual(20.0, first.indoor_temperature())
+        self.assertEqual(26.0, second.indoor_temperature())
+
+
+class TestInMemoryBackend(unittest.TestCase):
+
+    def test_room_view_reads_and_writes_shared_arrays(self):
+        backend = InMemoryBackend(3)
+        backend.pins[INFRARED_PIN][1] = True
+        backend.indoor[1] = 22.5
+        backend.outdoor[1] = 19.0
+        backend.co2[1] = 900
+        room = backend.room(1)
+
+        room.output(LED_PIN, True)
+
+        self.assertTrue(room.input(INFRARED_PIN))
+        self.assertFalse(room.input(PHOTO_PIN))
+        self.assertEqual((22.5, 19.0, 900), (room.indoor_temperature(), room.outdoor_temperature(), room.co2()))
+        self.assertEqual(bytearray([0, 1, 0]), backend.pins[LED_PIN])
+
+    def test_rooms_are_independent(self):
+        backend = InMemoryBackend(2)
+
+        backend.room(0).output(FAN_PIN, True)
+
+        self.assertFalse(backend.room(1).input(FAN_PIN))
+
+    def test_room_out_of_range(self):
+        with self.assertRaises(IndexError):
+            InMemoryBackend(2).room(2)
+
+    def test_unknown_pin(self):
+        with self.assertRaises(KeyError):
+            InMemoryBackend(1).room(0).input(99)
+
+    def test_per_room_rule_over_100k_rooms_without_patching(self):
+        rooms = 100_000
+        backend = InMemoryBackend(rooms)
+        backend.pins[INFRARED_PIN][:] = bytes([1, 1, 0, 0]) * (rooms // 4)
+        backend.pins[PHOTO_PIN][:] = bytes([0, 1, 0, 1]) * (rooms // 4)
+
+        lights = [manage_light_level(backend.room(index)) for index in range(rooms)]
+
+        self.assertEqual(rooms // 4, sum(lights))
+        self.assertEqual(bytes([1, 0, 0, 0]) * (rooms // 4), backend.pins[LED_PIN])
+
+    def test_batch_decisions_over_100k_rooms(self):
+        rooms = 100_000
+        backend = InMemoryBackend(rooms)
+        backend.indoor[:] = array("d", [20.0, 27.0]) * (rooms // 2)
+        backend.outdoor[:] = array("d", [23.0, 24.0]) * (rooms // 2)
+        backend.co2[:] = array("d", [850.0, 450.0]) * (rooms // 2)
+
+        light = decide_light(backend.pins[LED_PIN], backend.pins[INFRARED_PIN], backend.pins[PHOTO_PIN])
+        window = decide_window(bytearray(rooms), backend.indoor, backend.outdoor)
+        fan = decide_fan(backend.pins[FAN_PIN], backend.co2)
+
+        self.assertEqual(0, sum(light.states))
+        self.assertEqual(rooms // 2, sum(window.states))
+        self.assertEqual(rooms // 2, len(fan.actions))
+        self.assertEqual(rooms * 28, backend.nbytes)
@@ -0,0 +1,119 @@
+import threading
+import time
+import unittest
+
+from src.bus_pool import BusWorkerPool
+
+I2C_LATENCY = 0.002
+UART_LATENCY = 0.003
+
+
+class SlowBMP280:
+    """BMP280 stand-in whose reads take as long as an I2C transaction."""
+
+    def __init__(self, temperature: float):
+        self._temperature = temperature
+
+    @property
+    def temperature(self) -> float:
+        time.sleep(I2C_LATENCY)
+        return self._temperature
+
+
+class SlowSenseairS8:
+    """Senseair S8 stand-in whose reads take as long as a Modbus round trip."""
+
+    def __init__(self, co2: int):
+        self._co2 = co2
+
+    def co2(self) -> int:
+        time.sleep(UART_LATENCY)
+        return self._co2
+
+
+class Room:
+
+    def __init__(self, index: int):
+        self.indoor = SlowBMP280(20 + index)
+        self.outdoor = SlowBMP280(10 + index)
+        self.co2_sensor = SlowSenseairS8(500 + index)
+
+
+class TestBusWorkerPool(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = BusWorkerPool(["i2c", "uart"])
+        self.addCleanup(self.pool.close)
+
+    def test_submit_returns_future_with_result(self):
+        future = self.pool.submit("i2c", lambda value: value * 2, 21)
+
+        self.assertEqual(42, future.result(timeout=1))
+
+    def test_error_set_on_future(self):
+        def fail():
+            raise OSError("bus error")
+
+        future = self.pool.submit("uart", fail)
+
+        self.assertIsInstance(future.exception(timeout=1), OSError)
+        self.assertEqual(1, self.pool.submit("uart", lambda: 1).result(timeout=1))
+
+    def test_reads_on_one_bus_never_overlap(self):
+        active = []
+        overlaps = []
+        lock = threading.Lock()
+
+        def read():
+            with lock:
+                active.append(1)
+                overlaps.append(len(active) > 1)
+            time.sleep(0.001)
+            with lock:
+                active.pop()
+
+        for future in self.pool.map("i2c", [read] * 10):
+            future.result(timeout=1)
+
+        self.assertFalse(any(overlaps))
+
+    def test_queued_reads_batched(self):
+        release = threading.Event()
+        self.pool.submit("i2c", release.wait, 1)
+        futures = self.pool.map("i2c", [lambda: 1] * 20)
+        release.set()
+
+        self.assertEqual([1] * 20, [future.result(timeout=1) for future in futures])
+        stats = self.pool.stats()["i2c"]
+        self.assertEqual(21, stats["reads"])
+        self.assertLessEqual(stats["batches"], 3)
+
+    def test_unknown_bus(self):
+        with self.assertRaises(KeyError):
+            self.pool.submit("spi", lambda: 1)
+
+    def test_submit_after_close_rejected(self):
+        future = self.pool.submit("i2c", lambda: 1)
+        self.pool.close()
+
+        self.assertEqual(1, future.result(timeout=0))
+        with self.assertRaises(RuntimeError):
+            self.pool.submit("i2c", lambda: 1)
+
+    def test_fleet_tick_overlaps_buses(self):
+        rooms = [Room(index) for index in range(10)]
+
+        start = time.perf_counter()
+        serial = [(room.indoor.temperature, room.outdoor.temperature, room.co2_sensor.co2()) for room in rooms]
+        serial_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        futures = [(self.pool.submit("i2c", lambda room=room: room.indoor.temperature),
+                    self.pool.submit("i2c", lambda room=room: room.outdoor.temperature),
+                    self.pool.submit("uart", room.co2_sensor.co2)) for room in rooms]
+        pooled = [tuple(future.result(timeout=5) for future in room) for room in futures]
+        pooled_time = time.perf_counter() - start
+
+        self.assertEqual(serial, pooled)
+        # Serial: 10 * (2 + 2 + 3) ms. Pooled: max(10 * 4, 10 * 3) ms.
+        self.assertLess(pooled_time, serial_time * 0.8)
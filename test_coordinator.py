@@ -0,0 +1,105 @@
+import unittest
+from unittest.mock import Mock, call
+
+from src.coordinator import FAN, WINDOW, ActuationCoordinator
+from src.metrics import Metrics
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestActuationCoordinator(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.actuate = Mock()
+
+    def coordinator(self, **kwargs):
+        return ActuationCoordinator(self.actuate, clock=self.clock, **kwargs)
+
+    def executed(self, requests):
+        return [(request.room, request.actuator, request.value) for request in requests]
+
+    def test_servo_moves_spread_across_ticks(self):
+        coordinator = self.coordinator(max_servo_moves=2)
+        for room in range(5):
+            coordinator.request(room, WINDOW, 12)
+
+        self.assertEqual([0, 1], [request.room for request in coordinator.tick()])
+        self.assertEqual([2, 3], [request.room for request in coordinator.tick()])
+        self.assertEqual([4], [request.room for request in coordinator.tick()])
+        self.assertEqual(0, coordinator.queue_depth)
+        self.assertEqual(5, coordinator.max_queue_depth)
+        self.actuate.assert_has_calls([call(room, WINDOW, 12) for room in range(5)])
+
+    def test_fan_starts_limited_but_stops_are_not(self):
+        coordinator = self.coordinator(max_fan_starts=1)
+        coordinator.request(0, FAN, True)
+        coordinator.request(1, FAN, True)
+        coordinator.request(2, FAN, False)
+        coordinator.request(3, FAN, False)
+
+        self.assertEqual([(0, FAN, True), (2, FAN, False), (3, FAN, False)], self.executed(coordinator.tick()))
+        self.assertEqual([(1, FAN, True)], self.executed(coordinator.tick()))
+
+    def test_air_quality_before_comfort(self):
+        coordinator = self.coordinator(max_actuations=1)
+        coordinator.request(0, WINDOW, 12)
+        coordinator.request(1, FAN, True)
+
+        self.assertEqual([(1, FAN, True)], self.executed(coordinator.tick()))
+        self.assertEqual([(0, WINDOW, 12)], self.executed(coordinator.tick()))
+
+    def test_window_not_starved_by_fan_stream(self):
+        coordinator = self.coordinator(max_actuations=1, aging=3)
+        coordinator.request("window", WINDOW, 12)
+        served = None
+        for tick in range(20):
+            coordinator.request(f"fan{tick}", FAN, True)
+            if any(request.room == "window" for request in coordinator.tick()):
+                served = tick
+                break
+
+        self.assertEqual(3, served)
+
+    def test_newer_request_replaces_value_and_keeps_place(self):
+        coordinator = self.coordinator(max_servo_moves=1)
+        coordinator.request(0, WINDOW, 12)
+        coordinator.request(1, WINDOW, 12)
+        coordinator.request(0, WINDOW, 2)
+
+        self.assertEqual([(0, WINDOW, 2)], self.executed(coordinator.tick()))
+        self.assertEqual(1, coordinator.queue_depth)
+
+    def test_cancel(self):
+        coordinator = self.coordinator()
+        coordinator.request(0, WINDOW, 12)
+
+        coordinator.cancel(0, WINDOW)
+
+        self.assertEqual([], coordinator.tick())
+        self.actuate.assert_not_called()
+
+    def test_latency_observed(self):
+        metrics = Metrics(buckets=(1.0, 5.0), clock=self.clock)
+        coordinator = self.coordinator(max_servo_moves=1, metrics=metrics)
+        coordinator.request(0, WINDOW, 12)
+        coordinator.request(1, WINDOW, 12)
+        self.clock.now = 0.5
+        coordinator.tick()
+        self.clock.now = 2.0
+        coordinator.tick()
+
+        histogram = metrics.histograms["actuation_latency_seconds"]
+        self.assertEqual([1, 1, 0], histogram.counts)
+        self.assertEqual(2, metrics.counters["actuations"])
+
+    def test_invalid_budget_rejected(self):
+        with self.assertRaises(ValueError):
+            self.coordinator(max_servo_moves=0)
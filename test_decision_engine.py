@@ -0,0 +1,52 @@
+import unittest
+
+from rule_scenarios import FAN_SCENARIOS, LIGHT_SCENARIOS, WINDOW_SCENARIOS
+from src.decision_engine import Thresholds, decide_fan, decide_light, decide_window
+
+
+class TestDecisionEngine(unittest.TestCase):
+    """Every scenario table is evaluated as one batch, one room per row."""
+
+    def test_light_matches_scenarios(self):
+        light_on, occupied, enough_light, expected = zip(*LIGHT_SCENARIOS)
+
+        decision = decide_light(light_on, occupied, enough_light)
+
+        self.assertEqual(list(expected), [bool(state) for state in decision.states])
+        self.assertEqual(list(enumerate(expected)), decision.actions)
+
+    def test_window_matches_scenarios(self):
+        window_open, indoor, outdoor, angles, expected = zip(*WINDOW_SCENARIOS)
+
+        decision = decide_window(window_open, indoor, outdoor)
+
+        self.assertEqual(list(expected), [bool(state) for state in decision.states])
+        self.assertEqual([(room, angle) for room, angle in enumerate(angles) if angle is not None],
+                         decision.actions)
+
+    def test_fan_matches_scenarios(self):
+        fan_on, co2, writes, expected = zip(*FAN_SCENARIOS)
+
+        decision = decide_fan(fan_on, co2)
+
+        self.assertEqual(list(expected), [bool(state) for state in decision.states])
+        self.assertEqual([(room, write) for room, write in enumerate(writes) if write is not None],
+                         decision.actions)
+
+    def test_inputs_not_modified(self):
+        fan_on = [False, True]
+
+        decide_fan(fan_on, [900, 400])
+
+        self.assertEqual([False, True], fan_on)
+
+    def test_custom_thresholds(self):
+        thresholds = Thresholds(fan_on_co2=1000, fan_off_co2=600)
+
+        decision = decide_fan([False, True], [900, 550], thresholds)
+
+        self.assertEqual([(1, False)], decision.actions)
+
+    def test_mismatched_lengths_rejected(self):
+        with self.assertRaises(ValueError):
+            decide_window([False], [20, 21], [23, 24])
@@ -0,0 +1,150 @@
+import os
+import tempfile
+import unittest
+
+from src.event_log import CO2, FAN, RECORD, EventLogReader, EventLogWriter, segment_number, segment_paths
+
+
+class TestEventLog(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.directory = self.tmp.name
+
+    def test_records_round_trip(self):
+        with EventLogWriter(self.directory) as writer:
+            writer.append(1.5, 7, CO2, 812)
+            writer.append(2.5, 7, FAN, True)
+
+        records = list(EventLogReader(self.directory).records())
+
+        self.assertEqual([(1.5, 7, CO2, 812.0), (2.5, 7, FAN, 1.0)], records)
+
+    def test_records_buffered_until_flush(self):
+        writer = EventLogWriter(self.directory, buffer_records=4)
+        self.addCleanup(writer.close)
+        writer.append(1, 1, CO2, 500)
+
+        self.assertEqual([], list(EventLogReader(self.directory).records()))
+
+        writer.flush()
+        self.assertEqual(1, len(list(EventLogReader(self.directory).records())))
+
+    def test_bulk_write_when_buffer_full(self):
+        writer = EventLogWriter(self.directory, buffer_records=3)
+        self.addCleanup(writer.close)
+        for i in range(3):
+            writer.append(i, 1, CO2, 500)
+
+        self.assertEqual(3, len(list(EventLogReader(self.directory).records())))
+
+    def test_segments_rotate_after_segment_records(self):
+        with EventLogWriter(self.directory, segment_records=4, buffer_records=3) as writer:
+            for i in range(10):
+                writer.append(i, 1, CO2, 400 + i)
+
+        sizes = [os.path.getsize(path) for path in segment_paths(self.directory)]
+
+        self.assertEqual([4 * RECORD.size, 4 * RECORD.size, 2 * RECORD.size], sizes)
+        timestamps = [record[0] for record in EventLogReader(self.directory).records()]
+        self.assertEqual(list(range(10)), timestamps)
+
+    def test_new_writer_appends_to_new_segment(self):
+        with EventLogWriter(self.directory) as writer:
+            writer.append(1, 1, CO2, 500)
+        with EventLogWriter(self.directory) as writer:
+            writer.append(2, 1, CO2, 600)
+
+        self.assertEqual(2, len(segment_paths(self.directory)))
+        self.assertEqual([500, 600], [record[3] for record in EventLogReader(self.directory).records()])
+
+    def test_filter_by_room_and_kind(self):
+        with EventLogWriter(self.directory) as writer:
+            writer.append(1, 1, CO2, 500)
+            writer.append(1, 2, CO2, 600)
+            writer.append(1, 2, FAN, 1)
+
+        records = list(EventLogReader(self.directory).records(room_id=2, kind=CO2))
+
+        self.assertEqual([(1.0, 2, CO2, 600.0)], records)
+
+    def test_segments_are_zero_copy_views(self):
+        with EventLogWriter(self.directory) as writer:
+            writer.append(1, 1, CO2, 500)
+
+        for view in EventLogReader(self.directory).segments():
+            self.assertIsInstance(view, memoryview)
+            self.assertTrue(view.readonly)
+            self.assertEqual(RECORD.size, view.nbytes)
+
+    def test_partial_trailing_record_ignored(self):
+        with EventLogWriter(self.directory) as writer:
+            writer.append(1, 1, CO2, 500)
+        with open(segment_paths(self.directory)[0], "ab") as file:
+            file.write(b"\x00" * (RECORD.size // 2))
+
+        self.assertEqual(1, len(list(EventLogReader(self.directory).records())))
+
+    def test_empty_segment_skipped(self):
+        open(os.path.join(self.directory, "events-000000.log"), "wb").close()
+
+        self.assertEqual([], list(EventLogReader(self.directory).records()))
+
+    def test_no_empty_segment_left_on_rotation_boundary(self):
+        with EventLogWriter(self.directory, segment_records=2, buffer_records=2) as writer:
+            for i in range(4):
+                writer.append(i, 1, CO2, 500)
+
+        sizes = [os.path.getsize(path) for path in segment_paths(self.directory)]
+
+        self.assertEqual([2 * RECORD.size, 2 * RECORD.size], sizes)
+
+    def test_writer_without_records_creates_no_segment(self):
+        EventLogWriter(self.directory).close()
+
+        self.assertEqual([], segment_paths(self.directory))
+
+    def test_numbering_continues_after_pruned_segments(self):
+        with EventLogWriter(self.directory, segment_records=2) as writer:
+            for i in range(8):
+                writer.append(i, 1, CO2, 500)
+        for path in segment_paths(self.directory)[:2]:
+            os.remove(path)
+
+        with EventLogWriter(self.directory, segment_records=2) as writer:
+            writer.append(8, 1, CO2, 500)
+
+        paths = segment_paths(self.directory)
+        self.assertEqual(["events-000002.log", "events-000003.log", "events-000004.log"],
+                         [os.path.basename(path) for path in paths])
+        self.assertEqual(RECORD.size, os.path.getsize(paths[-1]))
+
+    def test_segments_sorted_by_number(self):
+        for number in [10, 9, 1000000]:
+            open(os.path.join(self.directory, f"events-{number:06d}.log"), "wb").close()
+
+        self.assertEqual([9, 10, 1000000], [segment_number(path) for path in segment_paths(self.directory)])
+
+    def test_append_after_close_rejected(self):
+        writer = EventLogWriter(self.directory)
+        writer.close()
+
+        with self.assertRaises(ValueError):
+            writer.append(1, 1, CO2, 500)
+
+    def test_derived_views_stay_valid_after_advancing(self):
+        with EventLogWriter(self.directory, segment_records=1) as writer:
+            writer.append(1, 1, CO2, 500)
+            writer.append(2, 1, CO2, 600)
+
+        kept = []
+        for view in EventLogReader(self.directory).segments():
+            kept.append(view[0:RECORD.size])
+            kept.append(view.cast("B"))
+            kept.append(memoryview(view))
+
+        self.assertEqual([(1.0, 1, CO2, 500.0)], list(RECORD.iter_unpack(kept[0])))
+        self.assertEqual([(2.0, 1, CO2, 600.0)], list(RECORD.iter_unpack(kept[3])))
+        self.assertEqual(RECORD.size, len(kept[4]))
+        self.assertEqual((2.0, 1, CO2, 600.0), RECORD.unpack(kept[5]))
@@ -0,0 +1,110 @@
+import time
+import unittest
+from unittest.mock import Mock
+
+from src.fleet import Fleet
+
+
+class FakeRoom:
+
+    def __init__(self):
+        self.calls = []
+
+    def manage_light_level(self):
+        self.calls.append("light")
+
+    def manage_window(self):
+        self.calls.append("window")
+
+    def monitor_air_quality(self):
+        self.calls.append("air")
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestFleet(unittest.TestCase):
+
+    def test_tick_runs_every_action_of_every_room(self):
+        fleet = Fleet()
+        rooms = [FakeRoom() for _ in range(3)]
+        for room_id, room in enumerate(rooms):
+            fleet.register(room_id, room)
+
+        fleet.tick()
+
+        for room in rooms:
+            self.assertEqual(["light", "window", "air"], room.calls)
+        self.assertEqual(1, fleet.ticks)
+
+    def test_register_rejects_duplicate_room_id(self):
+        fleet = Fleet()
+        fleet.register("101", FakeRoom())
+
+        with self.assertRaises(ValueError):
+            fleet.register("101", FakeRoom())
+
+    def test_unregistered_room_not_ticked(self):
+        fleet = Fleet()
+        room = FakeRoom()
+        fleet.register("101", room)
+        fleet.unregister("101")
+
+        fleet.tick()
+
+        self.assertEqual([], room.calls)
+        self.assertEqual(0, len(fleet))
+
+    def test_failing_room_does_not_stop_fleet(self):
+        fleet = Fleet()
+        broken = FakeRoom()
+        broken.manage_window = Mock(side_effect=RuntimeError("BMP280 disconnected"))
+        healthy = FakeRoom()
+        fleet.register("broken", broken)
+        fleet.register("healthy", healthy)
+
+        fleet.tick()
+
+        self.assertIsInstance(fleet.errors["broken"], RuntimeError)
+        self.assertEqual(["light", "window", "air"], healthy.calls)
+
+    def test_run_keeps_fixed_schedule(self):
+        clock = FakeClock()
+        fleet = Fleet(tick_interval=2.0, clock=clock, sleep=clock.sleep)
+        fleet.register("101", FakeRoom())
+
+        fleet.run(ticks=3)
+
+        self.assertEqual(3, fleet.ticks)
+        self.assertEqual(6.0, clock.now)
+        self.assertEqual(0, fleet.overruns)
+
+    def test_run_counts_overruns(self):
+        clock = FakeClock()
+        fleet = Fleet(tick_interval=1.0, clock=clock, sleep=clock.sleep)
+        slow = FakeRoom()
+        slow.manage_window = lambda: setattr(clock, "now", clock.now + 1.5)
+        fleet.register("slow", slow)
+
+        fleet.run(ticks=2)
+
+        self.assertEqual(2, fleet.overruns)
+
+    def test_loop_overhead_allows_5000_rooms_per_second(self):
+        fleet = Fleet(clock=time.perf_counter)
+        for room_id in range(5000):
+            fleet.register(room_id, FakeRoom())
+
+        seconds = fleet.tick()
+
+        self.assertLess(seconds, 1.0)
+        self.assertAlmostEqual(seconds / 5000, fleet.seconds_per_room)
@@ -0,0 +1,90 @@
+from array import array
+import random
+import unittest
+
+from rule_scenarios import FAN_SCENARIOS, LIGHT_SCENARIOS, WINDOW_SCENARIOS
+from src.decision_engine import decide_fan, decide_light, decide_window
+from src.incremental import IncrementalEngine
+
+
+class TestIncrementalEngine(unittest.TestCase):
+
+    def test_first_tick_matches_scenarios(self):
+        _, occupied, enough_light, light_expected = zip(*LIGHT_SCENARIOS)
+        engine = IncrementalEngine(len(occupied))
+        self.assertEqual(list(light_expected), [bool(state) for state in engine.light(occupied, enough_light).states])
+
+        fan_on, co2, writes, fan_expected = zip(*FAN_SCENARIOS)
+        engine = IncrementalEngine(len(co2))
+        engine.fan_on[:] = array("B", fan_on)
+        decision = engine.fan(co2)
+        self.assertEqual(list(fan_expected), [bool(state) for state in decision.states])
+        self.assertEqual([(room, write) for room, write in enumerate(writes) if write is not None], decision.actions)
+
+        window_open, indoor, outdoor, angles, window_expected = zip(*WINDOW_SCENARIOS)
+        engine = IncrementalEngine(len(indoor))
+        engine.window_open[:] = array("B", window_open)
+        decision = engine.window(indoor, outdoor)
+        self.assertEqual(list(window_expected), [bool(state) for state in decision.states])
+        self.assertEqual([(room, angle) for room, angle in enumerate(angles) if angle is not None], decision.actions)
+
+    def test_unchanged_inputs_skipped(self):
+        engine = IncrementalEngine(3)
+        engine.fan([900, 400, 600])
+
+        decision = engine.fan([900, 400, 600])
+
+        self.assertEqual([], decision.actions)
+        self.assertEqual(3, engine.evaluated["fan"])
+        self.assertEqual(3, engine.skipped["fan"])
+        self.assertEqual(0.5, engine.skipped_fraction("fan"))
+
+    def test_only_changed_rooms_evaluated(self):
+        engine = IncrementalEngine(3)
+        engine.light([True, True, False], [False, False, False])
+
+        decision = engine.light([True, False, False], [False, False, False])
+
+        self.assertEqual([(1, False)], decision.actions)
+        self.assertEqual([1, 0, 0], list(decision.states))
+        self.assertEqual(2, engine.skipped["light"])
+
+    def test_rules_tracked_separately(self):
+        engine = IncrementalEngine(1)
+        engine.window([20], [23])
+        engine.fan([600])
+
+        engine.window([20], [23])
+
+        self.assertEqual({"light": 0, "window": 1, "fan": 0}, engine.skipped)
+
+    def test_same_states_as_full_evaluation(self):
+        rooms, ticks = 50, 200
+        generator = random.Random(7)
+        engine = IncrementalEngine(rooms)
+        light_on, window_open, fan_on = [False] * rooms, [False] * rooms, [False] * rooms
+        occupied = [False] * rooms
+        indoor, outdoor, co2 = [22.0] * rooms, [22.0] * rooms, [600.0] * rooms
+        for _ in range(ticks):
+            for room in generator.sample(range(rooms), 5):
+                occupied[room] = not occupied[room]
+                indoor[room] = generator.choice([17.0, 20.0, 24.0, 31.0])
+                outdoor[room] = generator.choice([17.0, 20.0, 24.0, 31.0])
+                co2[room] = generator.choice([450.0, 650.0, 850.0])
+            enough_light = [room % 2 == 0 for room in range(rooms)]
+
+            light_on = list(decide_light(light_on, occupied, enough_light).states)
+            window_open = list(decide_window(window_open, indoor, outdoor).states)
+            fan_on = list(decide_fan(fan_on, co2).states)
+            engine.light(occupied, enough_light)
+            engine.window(indoor, outdoor)
+            engine.fan(co2)
+
+            self.assertEqual(light_on, list(engine.light_on))
+            self.assertEqual(window_open, list(engine.window_open))
+            self.assertEqual(fan_on, list(engine.fan_on))
+        self.assertGreater(engine.skipped_fraction("fan"), 0.85)
+
+    def test_mismatched_lengths_rejected(self):
+        with self.assertRaises(ValueError):
+            IncrementalEngine(2).fan([500])
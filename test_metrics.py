@@ -0,0 +1,111 @@
+import json
+import os
+import socket
+import tempfile
+import threading
+import unittest
+
+from src.metrics import Metrics
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.metrics = Metrics(buckets=(0.001, 0.01), clock=self.clock)
+
+    def test_counters(self):
+        self.metrics.count("sensor_reads")
+        self.metrics.count("sensor_reads", 2)
+
+        self.assertEqual({"sensor_reads": 3}, self.metrics.counters)
+
+    def test_timer_observes_phase_duration(self):
+        with self.metrics.timer("sense"):
+            self.clock.now += 0.005
+
+        histogram = self.metrics.histograms["sense"]
+        self.assertEqual([0, 1, 0], histogram.counts)
+        self.assertEqual(1, histogram.count)
+        self.assertAlmostEqual(0.005, histogram.sum)
+
+    def test_transition_counted_only_on_change(self):
+        self.metrics.transition("fan_on", False, True)
+        self.metrics.transition("fan_on", True, True)
+        self.metrics.transition("fan_on", True, False)
+
+        self.assertEqual({"fan_on_transitions": 2}, self.metrics.counters)
+
+    def test_disabled_metrics_record_nothing(self):
+        metrics = Metrics(enabled=False)
+
+        metrics.count("gpio_writes")
+        metrics.transition("light_on", False, True)
+        with metrics.timer("decide"):
+            pass
+
+        self.assertEqual({}, metrics.counters)
+        self.assertEqual({}, metrics.histograms)
+        self.assertIs(metrics.timer("decide"), metrics.timer("actuate"))
+
+    def test_prometheus_format(self):
+        self.metrics.count("servo_moves")
+        self.metrics.observe("actuate", 0.0005)
+        self.metrics.observe("actuate", 0.5)
+
+        text = self.metrics.to_prometheus()
+
+        self.assertIn("smart_room_servo_moves_total 1\n", text)
+        self.assertIn('smart_room_actuate_seconds_bucket{le="0.001"} 1\n', text)
+        self.assertIn('smart_room_actuate_seconds_bucket{le="0.01"} 1\n', text)
+        self.assertIn('smart_room_actuate_seconds_bucket{le="+Inf"} 2\n', text)
+        self.assertIn("smart_room_actuate_seconds_count 2\n", text)
+
+    def test_json_format(self):
+        self.metrics.count("gpio_writes")
+        self.metrics.observe("sense", 0.002)
+
+        data = json.loads(self.metrics.to_json())
+
+        self.assertEqual({"gpio_writes": 1}, data["counters"])
+        self.assertEqual([0, 1, 0], data["histograms"]["sense"]["counts"])
+
+    def test_unknown_format_rejected(self):
+        with self.assertRaises(ValueError):
+            self.metrics.render("xml")
+
+    def test_export_to_file(self):
+        self.metrics.count("sensor_reads")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "metrics.prom")
+
+            self.metrics.export(path)
+
+            with open(path) as file:
+                self.assertIn("smart_room_sensor_reads_total 1", file.read())
+            self.assertEqual(["metrics.prom"], os.listdir(directory))
+
+    def test_send_to_socket(self):
+        self.metrics.count("fan_on_transitions")
+        received = []
+        with socket.create_server(("127.0.0.1", 0)) as server:
+            def accept():
+                connection, _ = server.accept()
+                with connection:
+                    received.append(connection.makefile().read())
+            thread = threading.Thread(target=accept)
+            thread.start()
+
+            self.metrics.send(server.getsockname(), fmt="json")
+            thread.join(timeout=5)
+
+        self.assertEqual({"fan_on_transitions": 1}, json.loads(received[0])["counters"])
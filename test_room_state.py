@@ -0,0 +1,90 @@
+import unittest
+from unittest.mock import Mock
+
+from src.room_state import FAN_ON, LIGHT_ON, WINDOW_OPEN, DevicePool, RoomStateStore
+
+
+class TestRoomStateStore(unittest.TestCase):
+
+    def test_new_room_starts_with_everything_off(self):
+        room = RoomStateStore().add_room()
+
+        self.assertFalse(room.light_on)
+        self.assertFalse(room.window_open)
+        self.assertFalse(room.fan_on)
+
+    def test_flags_are_independent(self):
+        room = RoomStateStore().add_room()
+
+        room.window_open = True
+        room.fan_on = True
+        room.fan_on = False
+
+        self.assertFalse(room.light_on)
+        self.assertTrue(room.window_open)
+        self.assertFalse(room.fan_on)
+
+    def test_rooms_are_independent(self):
+        store = RoomStateStore()
+        first = store.add_room()
+        second = store.add_room()
+
+        first.light_on = True
+
+        self.assertFalse(second.light_on)
+        self.assertTrue(store.room(0).light_on)
+
+    def test_preallocated_rooms(self):
+        store = RoomStateStore(3)
+
+        store.room(2).fan_on = True
+
+        self.assertTrue(store.get(2, FAN_ON))
+        with self.assertRaises(IndexError):
+            store.room(3)
+
+    def test_count(self):
+        store = RoomStateStore(4)
+        store.set(0, LIGHT_ON, True)
+        store.set(3, LIGHT_ON, True)
+        store.set(3, WINDOW_OPEN, True)
+
+        self.assertEqual(2, store.count(LIGHT_ON))
+        self.assertEqual(1, store.count(WINDOW_OPEN))
+        self.assertEqual(0, store.count(FAN_ON))
+
+    def test_one_byte_per_room(self):
+        store = RoomStateStore(10_000)
+
+        self.assertEqual(10_000, store.nbytes)
+
+    def test_room_view_has_no_instance_dict(self):
+        room = RoomStateStore().add_room()
+
+        with self.assertRaises(AttributeError):
+            room.__dict__
+        with self.assertRaises(AttributeError):
+            room.heater_on = True
+
+
+class TestDevicePool(unittest.TestCase):
+
+    def test_same_key_shares_device(self):
+        factory = Mock(side_effect=lambda *key: object())
+        pool = DevicePool()
+
+        first = pool.get(factory, "i2c-1", 0x76)
+        second = pool.get(factory, "i2c-1", 0x76)
+
+        self.assertIs(first, second)
+        factory.assert_called_once_with("i2c-1", 0x76)
+
+    def test_different_keys_get_different_devices(self):
+        factory = Mock(side_effect=lambda *key: object())
+        pool = DevicePool()
+
+        indoor = pool.get(factory, "i2c-1", 0x76)
+        outdoor = pool.get(factory, "i2c-1", 0x77)
+
+        self.assertIsNot(indoor, outdoor)
+        self.assertEqual(2, len(pool))
@@ -0,0 +1,122 @@
+import threading
+import unittest
+
+from rule_scenarios import FAN_SCENARIOS, LIGHT_SCENARIOS, WINDOW_SCENARIOS
+from src.decision_engine import DEFAULT_THRESHOLDS
+from src.rule_config import CompiledConfig, RuleSet
+
+
+class TestCompiledRules(unittest.TestCase):
+
+    def setUp(self):
+        self.rules = CompiledConfig({}).room("101")
+
+    def test_defaults_are_the_smart_room_thresholds(self):
+        self.assertEqual(DEFAULT_THRESHOLDS, self.rules.thresholds)
+        self.assertEqual((18, 30, 2, 800, 500, 12, 2), tuple(self.rules.thresholds))
+
+    def test_light_matches_scenarios(self):
+        for _, occupied, enough_light, expected in LIGHT_SCENARIOS:
+            with self.subTest(occupied=occupied, enough_light=enough_light):
+                self.assertEqual(expected, self.rules.light(occupied, enough_light))
+
+    def test_window_matches_scenarios(self):
+        for _, indoor, outdoor, angle, _ in WINDOW_SCENARIOS:
+            with self.subTest(indoor=indoor, outdoor=outdoor):
+                self.assertEqual(angle, self.rules.window(indoor, outdoor))
+
+    def test_fan_matches_scenarios(self):
+        for fan_on, co2, write, _ in FAN_SCENARIOS:
+            with self.subTest(fan_on=fan_on, co2=co2):
+                self.assertEqual(write, self.rules.fan(fan_on, co2))
+
+
+class TestCompiledConfig(unittest.TestCase):
+
+    CONFIG = {
+        "defaults": {"fan_on_co2": 900},
+        "zones": {"lab": {"max_temperature": 26, "fan_off_co2": 450}},
+        "rooms": {"101": {"zone": "lab", "open_angle": 15}, 102: {"fan_off_co2": 600}},
+    }
+
+    def test_room_over_zone_over_defaults(self):
+        config = CompiledConfig(self.CONFIG)
+
+        thresholds = config.room(101).thresholds
+
+        self.assertEqual((26, 900, 450, 15), (thresholds.max_temperature, thresholds.fan_on_co2,
+                                              thresholds.fan_off_co2, thresholds.open_angle))
+        self.assertEqual(600, config.room("102").thresholds.fan_off_co2)
+        self.assertEqual(900, config.room("999").thresholds.fan_on_co2)
+
+    def test_overrides_change_decisions(self):
+        rules = CompiledConfig(self.CONFIG).room("101")
+
+        self.assertEqual(15, rules.window(20, 23))
+        self.assertEqual(2, rules.window(20, 26.5))
+        self.assertIsNone(rules.fan(False, 850))
+        self.assertIs(True, rules.fan(False, 900))
+
+    def test_equal_thresholds_share_rules(self):
+        config = CompiledConfig({"zones": {"a": {}, "b": {}}, "rooms": {"1": {"zone": "a"}, "2": {}}})
+
+        self.assertIs(config.defaults, config.zones["a"])
+        self.assertIs(config.room("1"), config.room("2"))
+
+    def test_invalid_configurations_rejected(self):
+        invalid = [
+            {"default": {}},
+            {"defaults": {"max_temp": 30}},
+            {"defaults": {"min_temperature": 31}},
+            {"defaults": {"temperature_gap": -1}},
+            {"zones": {"lab": {"fan_off_co2": 850}}},
+            {"rooms": {"101": {"zone": "missing"}}},
+        ]
+        for config in invalid:
+            with self.subTest(config=config):
+                with self.assertRaises(ValueError):
+                    CompiledConfig(config)
+
+
+class TestRuleSet(unittest.TestCase):
+
+    def test_reload_swaps_configuration(self):
+        rules = RuleSet()
+        before = rules.current
+
+        rules.reload({"defaults": {"fan_on_co2": 1000}})
+
+        self.assertEqual(800, before.room("101").thresholds.fan_on_co2)
+        self.assertEqual(1000, rules.current.room("101").thresholds.fan_on_co2)
+        self.assertEqual(1, rules.reloads)
+
+    def test_failed_reload_keeps_old_configuration(self):
+        rules = RuleSet({"defaults": {"fan_on_co2": 1000}})
+        before = rules.current
+
+        with self.assertRaises(ValueError):
+            rules.reload({"defaults": {"fan_on_co2": 100}})
+
+        self.assertIs(before, rules.current)
+        self.assertEqual(0, rules.reloads)
+
+    def test_loop_keeps_running_during_reloads(self):
+        rules = RuleSet()
+        stop = threading.Event()
+        seen = set()
+
+        def control_loop():
+            while not stop.is_set():
+                fan = rules.current.room("101").fan
+                seen.add(fan(False, 900))
+
+        loop = threading.Thread(target=control_loop)
+        loop.start()
+        for level in range(850, 1000, 10):
+            rules.reload({"defaults": {"fan_on_co2": level}})
+        stop.set()
+        loop.join()
+
+        self.assertEqual(15, rules.reloads)
+        self.assertTrue(seen <= {True, None})
+        self.assertIs(None, rules.current.room("101").fan(False, 900))
@@ -0,0 +1,75 @@
+import unittest
+import mock.GPIO as GPIO
+from unittest.mock import patch, PropertyMock
+
+from mock.adafruit_bmp280 import Adafruit_BMP280_I2C
+from mock.senseair_s8 import SenseairS8
+from src.smart_room import SmartRoom
+from rule_scenarios import FAN_SCENARIOS, LIGHT_SCENARIOS, WINDOW_SCENARIOS
+
+
+class TestSmartRoomScenarios(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # Kept in a dict: a PropertyMock stored as a class attribute would act as a descriptor.
+        cls.mocks = {}
+        cls.start_patch("gpio_output", patch.object(GPIO, "output"))
+        cls.start_patch("occupancy", patch.object(SmartRoom, "check_room_occupancy"))
+        cls.start_patch("light", patch.object(SmartRoom, "check_enough_light"))
+        cls.start_patch("temp", patch.object(Adafruit_BMP280_I2C, "temperature", new_callable=PropertyMock))
+        cls.start_patch("servo", patch.object(SmartRoom, "change_servo_angle"))
+        cls.start_patch("co2", patch.object(SenseairS8, "co2"))
+        cls.room = SmartRoom()
+
+    @classmethod
+    def start_patch(cls, name, patcher):
+        cls.mocks[name] = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
+    def reset_mocks(self):
+        for mocked in self.mocks.values():
+            mocked.reset_mock()
+
+    def test_light_scenarios(self):
+        for light_on, occupied, enough_light, expected_on in LIGHT_SCENARIOS:
+            with self.subTest(light_on=light_on, occupied=occupied, enough_light=enough_light):
+                self.reset_mocks()
+                self.room.light_on = light_on
+                self.mocks["occupancy"].return_value = occupied
+                self.mocks["light"].return_value = enough_light
+
+                self.room.manage_light_level()
+
+                self.mocks["gpio_output"].assert_called_once_with(self.room.LED_PIN, expected_on)
+                self.assertEqual(expected_on, self.room.light_on)
+
+    def test_window_scenarios(self):
+        for window_open, indoor, outdoor, angle, expected_open in WINDOW_SCENARIOS:
+            with self.subTest(window_open=window_open, indoor=indoor, outdoor=outdoor):
+                self.reset_mocks()
+                self.room.window_open = window_open
+                self.mocks["temp"].side_effect = [indoor, outdoor]
+
+                self.room.manage_window()
+
+                if angle is None:
+                    self.mocks["servo"].assert_not_called()
+                else:
+                    self.mocks["servo"].assert_called_once_with(angle)
+                self.assertEqual(expected_open, self.room.window_open)
+
+    def test_fan_scenarios(self):
+        for fan_on, co2, write, expected_on in FAN_SCENARIOS:
+            with self.subTest(fan_on=fan_on, co2=co2):
+                self.reset_mocks()
+                self.room.fan_on = fan_on
+                self.mocks["co2"].return_value = co2
+
+                self.room.monitor_air_quality()
+
+                if write is None:
+                    self.mocks["gpio_output"].assert_not_called()
+                else:
+                    self.mocks["gpio_output"].assert_called_once_with(self.room.FAN_PIN, write)
+                self.assertEqual(expected_on, self.room.fan_on)
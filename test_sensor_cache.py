@@ -0,0 +1,110 @@
+import unittest
+from unittest.mock import Mock
+
+from src.sensor_cache import CachedReading, SensorCache
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCachedReading(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.sensor = Mock(side_effect=[600, 650, 700])
+
+    def test_value_reused_within_ttl(self):
+        reading = CachedReading(self.sensor, ttl=2.0, clock=self.clock)
+
+        self.assertEqual(600, reading())
+        self.clock.now = 1.9
+        self.assertEqual(600, reading())
+
+        self.sensor.assert_called_once()
+        self.assertEqual(1, reading.hits)
+        self.assertEqual(1, reading.misses)
+
+    def test_value_reread_after_ttl(self):
+        reading = CachedReading(self.sensor, ttl=2.0, clock=self.clock)
+        reading()
+        self.clock.now = 2.0
+
+        self.assertEqual(650, reading())
+        self.assertEqual(2, reading.misses)
+
+    def test_invalidate_forces_reread(self):
+        reading = CachedReading(self.sensor, ttl=60.0, clock=self.clock)
+        reading()
+
+        reading.invalidate()
+
+        self.assertEqual(650, reading())
+        self.assertEqual(0, reading.hits)
+
+    def test_zero_ttl_never_caches(self):
+        reading = CachedReading(self.sensor, ttl=0.0, clock=self.clock)
+
+        self.assertEqual([600, 650], [reading(), reading()])
+
+    def test_failed_read_not_cached(self):
+        sensor = Mock(side_effect=[RuntimeError("S8 timeout"), 800])
+        reading = CachedReading(sensor, ttl=5.0, clock=self.clock)
+
+        with self.assertRaises(RuntimeError):
+            reading()
+        self.assertEqual(800, reading())
+
+    def test_negative_ttl_rejected(self):
+        with self.assertRaises(ValueError):
+            CachedReading(self.sensor, ttl=-1, clock=self.clock)
+
+
+class TestSensorCache(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = SensorCache(clock=self.clock)
+        self.indoor = Mock(side_effect=[21.0, 21.5])
+        self.co2 = Mock(side_effect=[600, 610])
+        self.cache.add("indoor", self.indoor, ttl=1.0)
+        self.cache.add("co2", self.co2, ttl=4.0)
+
+    def test_per_sensor_ttl(self):
+        self.cache.read("indoor")
+        self.cache.read("co2")
+        self.clock.now = 2.0
+
+        self.assertEqual(21.5, self.cache.read("indoor"))
+        self.assertEqual(600, self.cache.read("co2"))
+
+    def test_invalidate_one_sensor(self):
+        self.cache.read("indoor")
+        self.cache.read("co2")
+
+        self.cache.invalidate("co2")
+
+        self.assertEqual(21.0, self.cache.read("indoor"))
+        self.assertEqual(610, self.cache.read("co2"))
+
+    def test_invalidate_all_sensors(self):
+        self.cache.read("indoor")
+        self.cache.read("co2")
+
+        self.cache.invalidate()
+
+        self.assertEqual(21.5, self.cache.read("indoor"))
+        self.assertEqual(610, self.cache.read("co2"))
+
+    def test_stats(self):
+        self.cache.read("indoor")
+        self.cache.read("indoor")
+        self.cache.read("co2")
+
+        self.assertEqual({"indoor": {"hits": 1, "misses": 1}, "co2": {"hits": 0, "misses": 1}},
+                         self.cache.stats())
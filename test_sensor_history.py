@@ -0,0 +1,97 @@
+import unittest
+
+from src.sensor_history import RingBuffer, SensorHistory
+
+
+class TestRingBuffer(unittest.TestCase):
+
+    def test_window_returns_samples_oldest_first(self):
+        buffer = RingBuffer(4)
+        for value in [1, 2, 3]:
+            buffer.append(value)
+
+        self.assertEqual([1, 2, 3], buffer.window().tolist())
+        self.assertEqual(3, len(buffer))
+
+    def test_oldest_samples_overwritten_when_full(self):
+        buffer = RingBuffer(3)
+        for value in [1, 2, 3, 4, 5]:
+            buffer.append(value)
+
+        self.assertEqual([3, 4, 5], buffer.window().tolist())
+        self.assertEqual(3, len(buffer))
+
+    def test_window_of_last_n_samples(self):
+        buffer = RingBuffer(3)
+        for value in [1, 2, 3, 4]:
+            buffer.append(value)
+
+        self.assertEqual([3, 4], buffer.window(2).tolist())
+        self.assertEqual([2, 3, 4], buffer.window(10).tolist())
+
+    def test_window_is_a_view_not_a_copy(self):
+        buffer = RingBuffer(3)
+        buffer.append(1)
+        view = buffer.window()
+
+        self.assertIsInstance(view, memoryview)
+        self.assertIs(buffer._data, view.obj)
+
+    def test_statistics_over_last_n_samples(self):
+        buffer = RingBuffer(4)
+        for value in [10, 20, 30, 40, 50]:
+            buffer.append(value)
+
+        self.assertEqual(20, buffer.min())
+        self.assertEqual(50, buffer.max())
+        self.assertEqual(35, buffer.mean())
+        self.assertEqual(40, buffer.min(2))
+        self.assertEqual(45, buffer.mean(2))
+
+    def test_statistics_raise_when_empty(self):
+        buffer = RingBuffer(4)
+
+        with self.assertRaises(ValueError):
+            buffer.mean()
+        with self.assertRaises(ValueError):
+            buffer.max(3)
+
+    def test_negative_window_rejected(self):
+        buffer = RingBuffer(4)
+        buffer.append(1)
+
+        with self.assertRaises(ValueError):
+            buffer.window(-1)
+        with self.assertRaises(ValueError):
+            buffer.mean(-1)
+
+    def test_capacity_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            RingBuffer(0)
+
+
+class TestSensorHistory(unittest.TestCase):
+
+    def test_records_every_channel(self):
+        history = SensorHistory(capacity=8)
+
+        history.record_temperatures(20.5, 23)
+        history.record_co2(800)
+        history.record_light_inputs(True, False)
+
+        self.assertEqual([20.5], history.indoor_temperature.window().tolist())
+        self.assertEqual([23], history.outdoor_temperature.window().tolist())
+        self.assertEqual([800], history.co2.window().tolist())
+        self.assertEqual([1], history.occupancy.window().tolist())
+        self.assertEqual([0], history.light.window().tolist())
+
+    def test_memory_stays_bounded(self):
+        history = SensorHistory()
+        for i in range(10 * SensorHistory.DEFAULT_CAPACITY):
+            history.record_temperatures(20, 22)
+            history.record_co2(600 + i)
+            history.record_light_inputs(i % 2, True)
+
+        # 10k rooms must fit well under 100 MB.
+        self.assertLess(history.nbytes * 10_000, 64 * 1024 * 1024)
+        self.assertEqual(SensorHistory.DEFAULT_CAPACITY, len(history.co2))
@@ -0,0 +1,66 @@
+import unittest
+
+from src.decision_engine import Thresholds
+from src.simulation import Event, Sample, samples_from_traces, simulate
+
+
+class TestSimulation(unittest.TestCase):
+
+    def test_records_state_changes_with_simulated_time(self):
+        samples = [
+            Sample([20, 20], [23, 21], [600, 850], [True, False], [False, True]),
+            Sample([20, 20], [23, 21], [600, 450], [False, False], [False, True]),
+            Sample([20, 17], [19, 21], [810, 450], [False, False], [False, True]),
+        ]
+
+        timeline = simulate(samples, rooms=2, interval=60.0)
+
+        self.assertEqual([
+            Event(0.0, 0, "light_on", True),
+            Event(0.0, 0, "window_open", True),
+            Event(0.0, 1, "fan_on", True),
+            Event(60.0, 0, "light_on", False),
+            Event(60.0, 1, "fan_on", False),
+            Event(120.0, 0, "fan_on", True),
+        ], timeline.events)
+        self.assertEqual([False, False], timeline.light_on)
+        self.assertEqual([True, False], timeline.window_open)
+        self.assertEqual([True, False], timeline.fan_on)
+
+    def test_counts_raw_writes(self):
+        samples = [Sample([17], [31], [600], [False], [True])] * 3
+
+        timeline = simulate(samples, rooms=1)
+
+        # The out-of-range window is re-commanded closed on every step.
+        self.assertEqual({"light": 3, "window": 3, "fan": 0}, timeline.writes)
+        self.assertEqual([], timeline.events)
+
+    def test_thresholds_can_be_changed(self):
+        samples = [Sample([20], [21], [850], [False], [True])]
+
+        timeline = simulate(samples, rooms=1, thresholds=Thresholds(fan_on_co2=900))
+
+        self.assertEqual([False], timeline.fan_on)
+
+    def test_samples_from_per_room_traces(self):
+        samples = list(samples_from_traces(
+            indoor=[[20, 21], [22, 23]],
+            outdoor=[[24, 25], [26, 27]],
+            co2=[[600, 610], [700, 710]],
+            occupied=[[True, False], [False, True]],
+            enough_light=[[False, False], [True, True]],
+        ))
+
+        self.assertEqual(Sample((20, 22), (24, 26), (600, 700), (True, False), (False, True)), samples[0])
+        self.assertEqual(2, len(samples))
+
+    def test_traces_can_be_generators(self):
+        steps = 1000
+        co2 = [(400 + step for step in range(steps))]
+        constant = [[20] * steps]
+
+        timeline = simulate(samples_from_traces(constant, constant, co2, [[False] * steps], [[True] * steps]),
+                            rooms=1)
+
+        self.assertEqual([Event(400.0, 0, "fan_on", True)], timeline.events)
@@ -0,0 +1,151 @@
+import asyncio
+import base64
+import json
+import os
+import struct
+import unittest
+
+from src.state_server import StateServer, state_diff, websocket_frame
+
+
+async def read_response(reader):
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode().split("\r\n")
+    headers = dict(line.split(": ", 1) for line in lines[1:] if line)
+    body = await reader.readexactly(int(headers["Content-Length"]))
+    return lines[0], headers, json.loads(body)
+
+
+async def read_frame(reader):
+    first, second = await reader.readexactly(2)
+    length = second & 0x7F
+    if length == 126:
+        length, = struct.unpack("!H", await reader.readexactly(2))
+    elif length == 127:
+        length, = struct.unpack("!Q", await reader.readexactly(8))
+    return first & 0x0F, await reader.readexactly(length)
+
+
+def client_frame(payload, opcode):
+    mask = os.urandom(4)
+    masked = bytes(byte ^ mask[index % 4] for index, byte in enumerate(payload))
+    return struct.pack("!BB", 0x80 | opcode, 0x80 | len(payload)) + mask + masked
+
+
+class TestStateDiff(unittest.TestCase):
+
+    def test_only_changed_fields(self):
+        old = {"101": {"light_on": False, "fan_on": True}}
+        new = {"101": {"light_on": True, "fan_on": True}, "102": {"fan_on": False}}
+
+        self.assertEqual({"101": {"light_on": True}, "102": {"fan_on": False}}, state_diff(old, new))
+
+    def test_removed_room(self):
+        self.assertEqual({"101": None}, state_diff({"101": {"fan_on": True}}, {}))
+
+    def test_frame_lengths(self):
+        self.assertEqual(b"\x81\x02hi", websocket_frame(b"hi"))
+        self.assertEqual(b"\x81\x7e\x01\x00", websocket_frame(b"x" * 256)[:4])
+        self.assertEqual(b"\x81\x7f", websocket_frame(b"x" * 70000)[:2])
+
+
+class TestStateServer(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = StateServer(history=lambda room: {"co2": [600, 610]})
+        await self.server.start()
+        self.server.publish({101: {"light_on": False, "window_open": True, "fan_on": False}})
+
+    async def asyncTearDown(self):
+        await self.server.stop()
+
+    async def connect(self):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+        self.addCleanup(writer.close)
+        return reader, writer
+
+    async def subscribe(self):
+        reader, writer = await self.connect()
+        key = base64.b64encode(os.urandom(16)).decode()
+        writer.write((f"GET /subscribe HTTP/1.1\r\nHost: localhost\r\nUpgrade: websocket\r\n"
+                      f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n").encode())
+        status = await reader.readuntil(b"\r\n\r\n")
+        self.assertTrue(status.startswith(b"HTTP/1.1 101"))
+        return reader, writer
+
+    async def test_state_snapshot(self):
+        reader, writer = await self.connect()
+        writer.write(b"GET /state HTTP/1.1\r\nHost: localhost\r\n\r\n")
+
+        status, _, body = await read_response(reader)
+
+        self.assertEqual("HTTP/1.1 200 OK", status)
+        self.assertEqual({"101": {"light_on": False, "window_open": True, "fan_on": False}}, body)
+
+    async def test_connection_reused_between_requests(self):
+        reader, writer = await self.connect()
+
+        writer.write(b"GET /rooms/101 HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        _, headers, room = await read_response(reader)
+        writer.write(b"GET /rooms/101/history HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        _, _, history = await read_response(reader)
+
+        self.assertEqual("keep-alive", headers["Connection"])
+        self.assertTrue(room["window_open"])
+        self.assertEqual({"co2": [600, 610]}, history)
+
+    async def test_unknown_room_not_found(self):
+        reader, writer = await self.connect()
+        writer.write(b"GET /rooms/999 HTTP/1.1\r\nConnection: close\r\n\r\n")
+
+        status, headers, _ = await read_response(reader)
+
+        self.assertEqual("HTTP/1.1 404 Not Found", status)
+        self.assertEqual("close", headers["Connection"])
+
+    async def test_subscriber_gets_snapshot_then_diffs(self):
+        reader, _ = await self.subscribe()
+
+        _, snapshot = await read_frame(reader)
+        self.server.publish({101: {"light_on": True, "window_open": True, "fan_on": False}})
+        _, diff = await read_frame(reader)
+
+        self.assertEqual({"101": {"light_on": False, "window_open": True, "fan_on": False}}, json.loads(snapshot))
+        self.assertEqual({"101": {"light_on": True}}, json.loads(diff))
+
+    async def test_unchanged_state_sends_nothing(self):
+        reader, _ = await self.subscribe()
+        await read_frame(reader)
+
+        diff = self.server.publish({101: {"light_on": False, "window_open": True, "fan_on": False}})
+
+        self.assertEqual({}, diff)
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(read_frame(reader), 0.1)
+
+    async def test_diff_serialized_once_for_all_subscribers(self):
+        readers = []
+        for _ in range(5):
+            reader, _ = await self.subscribe()
+            await read_frame(reader)
+            readers.append(reader)
+        before = self.server.serializations
+
+        self.server.publish({101: {"light_on": False, "window_open": False, "fan_on": True}})
+
+        self.assertEqual(before + 1, self.server.serializations)
+        for reader in readers:
+            _, diff = await read_frame(reader)
+            self.assertEqual({"101": {"window_open": False, "fan_on": True}}, json.loads(diff))
+
+    async def test_ping_and_close(self):
+        reader, writer = await self.subscribe()
+        await read_frame(reader)
+
+        writer.write(client_frame(b"hello", 0x9))
+        self.assertEqual((0xA, b"hello"), await read_frame(reader))
+        writer.write(client_frame(b"\x03\xe8", 0x8))
+        self.assertEqual((0x8, b"\x03\xe8"), await read_frame(reader))
+
+        await asyncio.sleep(0.01)
+        self.assertEqual(0, self.server.subscribers)
@@ -0,0 +1,125 @@
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+
+from rule_scenarios import WINDOW_SCENARIOS
+from src.decision_engine import decide_window
+from src.window_control import WindowController
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+# Outdoor temperature hovering around the 30 C bound while the room is cooler.
+HOVERING = [(26, 29.4), (26, 30.2)] * 10
+
+
+class TestWindowController(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.servo = Mock()
+
+    def controller(self, **kwargs):
+        return WindowController(self.servo, clock=self.clock, **kwargs)
+
+    def test_without_hysteresis_states_match_scenarios(self):
+        for window_open, indoor, outdoor, _, expected_open in WINDOW_SCENARIOS:
+            with self.subTest(window_open=window_open, indoor=indoor, outdoor=outdoor):
+                controller = self.controller(hysteresis=0, min_dwell=0)
+                controller.window_open = window_open
+
+                controller.update(indoor, outdoor)
+
+                self.assertEqual(expected_open, controller.window_open)
+
+    def test_position_already_held_not_recommanded(self):
+        controller = self.controller(hysteresis=0, min_dwell=0)
+
+        self.assertIsNone(controller.update(17, 31))
+
+        self.servo.assert_not_called()
+
+    def test_hysteresis_stops_thrash_at_range_bound(self):
+        current = 0
+        window_open = [False]
+        for indoor, outdoor in HOVERING:
+            decision = decide_window(window_open, [indoor], [outdoor])
+            window_open = list(decision.states)
+            current += len(decision.actions)
+        controller = self.controller(hysteresis=0.5, min_dwell=0)
+
+        for indoor, outdoor in HOVERING:
+            controller.update(indoor, outdoor)
+
+        self.assertEqual(20, current)
+        self.assertEqual(1, controller.moves)
+        self.servo.assert_called_once_with(12)
+
+    def test_closes_beyond_hysteresis_band(self):
+        controller = self.controller(hysteresis=0.5, min_dwell=0)
+        controller.update(26, 29)
+
+        self.assertIsNone(controller.update(26, 30.5))
+        self.assertEqual(2, controller.update(26, 30.6))
+        self.assertFalse(controller.window_open)
+
+    def test_opening_needs_gap_beyond_hysteresis(self):
+        controller = self.controller(hysteresis=0.5, min_dwell=0)
+
+        self.assertIsNone(controller.update(22, 24.4))
+        self.assertEqual(12, controller.update(22, 24.6))
+
+    def test_min_dwell_delays_next_move(self):
+        controller = self.controller(hysteresis=0, min_dwell=60)
+        controller.update(20, 23)
+        self.clock.now = 59
+
+        self.assertIsNone(controller.update(27, 24))
+        self.assertTrue(controller.window_open)
+
+        self.clock.now = 60
+        self.assertEqual(2, controller.update(27, 24))
+        self.assertEqual(2, controller.moves)
+
+    def test_blocking_move_error_leaves_state_unchanged(self):
+        self.servo.side_effect = RuntimeError("servo stalled")
+        controller = self.controller(min_dwell=0)
+
+        with self.assertRaises(RuntimeError):
+            controller.update(20, 23)
+        self.assertFalse(controller.window_open)
+
+    def test_non_blocking_move_returns_while_servo_moves(self):
+        release = threading.Event()
+        self.servo.side_effect = lambda angle: release.wait(5)
+        controller = self.controller(min_dwell=0, blocking=False)
+        self.addCleanup(controller.close)
+
+        self.assertEqual(12, controller.update(20, 23))
+        self.assertTrue(controller.moving)
+        self.assertIsNone(controller.update(27, 24))
+
+        release.set()
+        controller.wait()
+        self.assertFalse(controller.moving)
+        self.assertEqual(2, controller.update(27, 24))
+
+    def test_non_blocking_move_error_raised_on_next_update(self):
+        self.servo.side_effect = RuntimeError("servo stalled")
+        controller = self.controller(min_dwell=0, blocking=False)
+        self.addCleanup(controller.close)
+        controller.update(20, 23)
+        while controller.moving:
+            time.sleep(0.001)
+
+        with self.assertRaises(RuntimeError):
+            controller.update(20, 23)
+        self.assertFalse(controller.window_open)